@@ -127,6 +127,9 @@ func setupRoutes(router *gin.Engine) {
 			// Statistics routes
 			protected.GET("/stats/summary", GetTransactionSummary)
 			protected.GET("/stats/monthly", GetMonthlyStats)
+
+			// Reports routes
+			protected.GET("/reports/bundle", GetReportsBundle)
 		}
 	}
 }
@@ -317,8 +320,8 @@ func DeleteTransaction(c *gin.Context) {
 func GetTransactionSummary(c *gin.Context) {
 	userID, _ := c.Get("user_id")
 
-	var totalIncome, totalExpense float64
-	var transactionCount int64
+	var totalIncome, totalExpense, averageAmount float64
+	var transactionCount, categoriesCount int64
 
 	// Count total transactions
 	DB.Model(&Transaction{}).Where("user_id = ?", userID).Count(&transactionCount)
@@ -329,6 +332,10 @@ func GetTransactionSummary(c *gin.Context) {
 	// Sum negative amounts (expenses)
 	DB.Model(&Transaction{}).Where("user_id = ? AND amount < 0", userID).Select("COALESCE(SUM(ABS(amount)), 0)").Scan(&totalExpense)
 
+	// Distinct categories in use and mean amount for the dashboard cards
+	DB.Model(&Transaction{}).Where("user_id = ? AND category_id IS NOT NULL", userID).Distinct("category_id").Count(&categoriesCount)
+	DB.Model(&Transaction{}).Where("user_id = ?", userID).Select("COALESCE(AVG(amount), 0)").Scan(&averageAmount)
+
 	balance := totalIncome - totalExpense
 
 	c.JSON(http.StatusOK, gin.H{
@@ -337,6 +344,8 @@ func GetTransactionSummary(c *gin.Context) {
 			"total_expense":     totalExpense,
 			"balance":           balance,
 			"transaction_count": transactionCount,
+			"categories_count":  categoriesCount,
+			"average_amount":    averageAmount,
 		},
 	})
 }
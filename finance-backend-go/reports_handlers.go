@@ -0,0 +1,177 @@
+package main
+
+import (
+	"net/http"
+
+	"github.com/gin-gonic/gin"
+)
+
+// GetReportsBundle composes the four queries the reports page needs
+// (monthly stats, category stats, transactions, transaction summary)
+// into one response so the desktop client pays one round-trip instead
+// of four.
+func GetReportsBundle(c *gin.Context) {
+	userID, exists := c.Get("user_id")
+	if !exists {
+		c.JSON(http.StatusUnauthorized, ErrorResponse{
+			Error:   "unauthorized",
+			Message: "User ID tidak ditemukan",
+		})
+		return
+	}
+
+	// --- Monthly stats (same query as GetMonthlyStats) ---
+	type MonthlyData struct {
+		Month   string  `json:"month"`
+		Income  float64 `json:"income"`
+		Expense float64 `json:"expense"`
+		Balance float64 `json:"balance"`
+	}
+
+	var monthlyStats []MonthlyData
+
+	monthlyQuery := `
+		SELECT
+			TO_CHAR(transaction_date, 'YYYY-MM') as month,
+			COALESCE(SUM(CASE WHEN amount > 0 THEN amount ELSE 0 END), 0) as income,
+			COALESCE(SUM(CASE WHEN amount < 0 THEN ABS(amount) ELSE 0 END), 0) as expense
+		FROM transactions
+		WHERE user_id = ?
+			AND transaction_date >= NOW() - INTERVAL '6 months'
+		GROUP BY TO_CHAR(transaction_date, 'YYYY-MM')
+		ORDER BY month DESC
+	`
+
+	monthlyRows, err := DB.Raw(monthlyQuery, userID).Rows()
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, ErrorResponse{
+			Error:   "database_error",
+			Message: "Gagal mengambil statistik bulanan",
+		})
+		return
+	}
+	defer monthlyRows.Close()
+
+	for monthlyRows.Next() {
+		var data MonthlyData
+		if err := monthlyRows.Scan(&data.Month, &data.Income, &data.Expense); err != nil {
+			continue
+		}
+		data.Balance = data.Income - data.Expense
+		monthlyStats = append(monthlyStats, data)
+	}
+
+	// --- Category stats (same queries as GetCategoryStats) ---
+	type CategoryStat struct {
+		CategoryID   *uint   `json:"category_id"`
+		CategoryName string  `json:"category_name"`
+		Count        int64   `json:"transaction_count"`
+		TotalAmount  float64 `json:"total_amount"`
+		AvgAmount    float64 `json:"avg_amount"`
+	}
+
+	var categoryStats []CategoryStat
+
+	categoryQuery := `
+		SELECT
+			t.category_id,
+			COALESCE(c.name, 'Tidak Berkategori') as category_name,
+			COUNT(*) as count,
+			COALESCE(SUM(t.amount), 0) as total_amount,
+			COALESCE(AVG(t.amount), 0) as avg_amount
+		FROM transactions t
+		LEFT JOIN categories c ON t.category_id = c.id
+		WHERE t.user_id = ?
+		GROUP BY t.category_id, c.name
+		ORDER BY count DESC
+	`
+
+	categoryRows, err := DB.Raw(categoryQuery, userID).Rows()
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, ErrorResponse{
+			Error:   "database_error",
+			Message: "Gagal mengambil statistik kategori",
+		})
+		return
+	}
+	defer categoryRows.Close()
+
+	for categoryRows.Next() {
+		var stat CategoryStat
+		if err := categoryRows.Scan(&stat.CategoryID, &stat.CategoryName, &stat.Count, &stat.TotalAmount, &stat.AvgAmount); err != nil {
+			continue
+		}
+		categoryStats = append(categoryStats, stat)
+	}
+
+	type MethodStat struct {
+		Method string `json:"method"`
+		Count  int64  `json:"count"`
+	}
+
+	var totalTransactions int64
+	DB.Model(&Transaction{}).Where("user_id = ?", userID).Count(&totalTransactions)
+
+	// Simulate method distribution (in real implementation, this would come from database)
+	methodStats := []MethodStat{
+		{Method: "ai_prediction", Count: totalTransactions * 7 / 10},
+		{Method: "manual", Count: totalTransactions * 2 / 10},
+		{Method: "default", Count: totalTransactions * 1 / 10},
+	}
+
+	// --- Transactions (same response shape as GetTransactions, no filters) ---
+	var transactions []Transaction
+	if err := DB.Where("user_id = ?", userID).Preload("Category").
+		Order("transaction_date DESC, created_at DESC").Find(&transactions).Error; err != nil {
+		c.JSON(http.StatusInternalServerError, ErrorResponse{
+			Error:   "database_error",
+			Message: "Gagal mengambil data transaksi",
+		})
+		return
+	}
+
+	var responseTransactions []TransactionResponse
+	for _, transaction := range transactions {
+		var categoryName string
+		if transaction.Category != nil {
+			categoryName = transaction.Category.Name
+		}
+
+		responseTransactions = append(responseTransactions, TransactionResponse{
+			ID:               transaction.ID,
+			Description:      transaction.Description,
+			Amount:           transaction.Amount,
+			TransactionDate:  transaction.TransactionDate,
+			CategoryID:       transaction.CategoryID,
+			CategoryName:     categoryName,
+			UserID:           transaction.UserID,
+			CreatedAt:        transaction.CreatedAt,
+			UpdatedAt:        transaction.UpdatedAt,
+			AIConfidence:     0.0,      // Historical transactions don't have AI confidence
+			PredictionMethod: "manual", // Historical transactions are manual
+		})
+	}
+
+	// --- Transaction summary (same aggregates as GetTransactionSummary) ---
+	var totalIncome, totalExpense float64
+
+	DB.Model(&Transaction{}).Where("user_id = ? AND amount > 0", userID).Select("COALESCE(SUM(amount), 0)").Scan(&totalIncome)
+	DB.Model(&Transaction{}).Where("user_id = ? AND amount < 0", userID).Select("COALESCE(SUM(ABS(amount)), 0)").Scan(&totalExpense)
+
+	c.JSON(http.StatusOK, gin.H{
+		"monthly_stats": monthlyStats,
+		"category_stats": gin.H{
+			"category_distribution": categoryStats,
+			"prediction_methods":    methodStats,
+			"total_transactions":    totalTransactions,
+			"total_categories":      len(categoryStats),
+		},
+		"transactions": responseTransactions,
+		"transaction_summary": gin.H{
+			"total_income":      totalIncome,
+			"total_expense":     totalExpense,
+			"balance":           totalIncome - totalExpense,
+			"transaction_count": totalTransactions,
+		},
+	})
+}
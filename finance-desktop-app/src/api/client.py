@@ -6,6 +6,7 @@ Handles communication with the Go backend server
 import requests
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 from requests.exceptions import RequestException, ConnectionError, Timeout
 import sys
@@ -21,6 +22,10 @@ class APIClient:
         self.base_url = base_url.rstrip('/')
         self.token = None
         self.session = requests.Session()
+        # Short-lived response cache keyed by endpoint, (monotonic_ts, data)
+        self._resp_cache: Dict[str, Any] = {}
+        # Small pool for coalescing concurrent multi-endpoint loads
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
         
         # Set default headers
         self.session.headers.update({
@@ -96,6 +101,40 @@ class APIClient:
             log_api_response(method.upper(), endpoint, 0, error=error_msg)
             raise Exception(error_msg)
     
+    def _cached_get(self, endpoint: str, ttl: float) -> Dict[str, Any]:
+        """GET with a short TTL cache so repeated navigations reuse responses"""
+        entry = self._resp_cache.get(endpoint)
+        now = time.monotonic()
+        if entry is not None and now - entry[0] < ttl:
+            return entry[1]
+        data = self._make_request('GET', endpoint)
+        self._resp_cache[endpoint] = (now, data)
+        return data
+
+    def flush_cache(self, prefix: Optional[str] = None):
+        """Drop cached responses; called after any mutation.
+
+        With a prefix, only endpoints under it are dropped, so e.g.
+        '/api/v1/stats' invalidates the stats family without discarding
+        the transactions list.
+        """
+        if prefix is None:
+            self._resp_cache.clear()
+            return
+        for endpoint in [e for e in self._resp_cache if e.startswith(prefix)]:
+            del self._resp_cache[endpoint]
+
+    def get_many(self, *names: str) -> Dict[str, Any]:
+        """Fetch several get_* helpers concurrently over the shared session.
+
+        The backend exposes no batch endpoint, so a page that needs e.g.
+        monthly stats, category stats and transactions dispatches them in
+        parallel and waits for the slowest instead of summing latencies.
+        Returns {name: response} in the order requested.
+        """
+        futures = [(name, self._io_pool.submit(getattr(self, name))) for name in names]
+        return {name: future.result() for name, future in futures}
+
     def login(self, username: str, password: str) -> Dict[str, Any]:
         """Login user and store auth token"""
         log_app_event("login_attempt", "APIClient", {"username": username})
@@ -110,6 +149,8 @@ class APIClient:
         # Store token for future requests
         if 'token' in result:
             self.token = result['token']
+            # Never serve responses cached under a previous account
+            self.flush_cache()
             log_app_event("login_success", "APIClient", {"username": username})
         else:
             log_app_event("login_failed", "APIClient", {"username": username, "reason": "no_token_in_response"})
@@ -138,19 +179,28 @@ class APIClient:
                 self.token = None
                 if 'Authorization' in self.session.headers:
                     del self.session.headers['Authorization']
+                # The cache holds this account's data; drop it so a
+                # later login can't read it within the TTL window
+                self.flush_cache()
                 log_app_event("logout_success", "APIClient")
     
     def get_transactions(self) -> Dict[str, Any]:
-        return self._make_request('GET', '/api/v1/transactions')
+        return self._cached_get('/api/v1/transactions', ttl=5)
     
     def create_transaction(self, transaction_data: Dict) -> Dict[str, Any]:
-        return self._make_request('POST', '/api/v1/transactions', transaction_data)
+        result = self._make_request('POST', '/api/v1/transactions', transaction_data)
+        self.flush_cache()
+        return result
     
     def update_transaction(self, transaction_id: int, transaction_data: Dict) -> Dict[str, Any]:
-        return self._make_request('PUT', f'/api/v1/transactions/{transaction_id}', transaction_data)
+        result = self._make_request('PUT', f'/api/v1/transactions/{transaction_id}', transaction_data)
+        self.flush_cache()
+        return result
     
     def delete_transaction(self, transaction_id: int) -> Dict[str, Any]:
-        return self._make_request('DELETE', f'/api/v1/transactions/{transaction_id}')
+        result = self._make_request('DELETE', f'/api/v1/transactions/{transaction_id}')
+        self.flush_cache()
+        return result
     
     def get_categories(self) -> Dict[str, Any]:
         return self._make_request('GET', '/api/v1/categories')
@@ -159,7 +209,9 @@ class APIClient:
         return self._make_request('GET', '/api/v1/profile')
     
     def recategorize_transaction(self, transaction_id: int) -> Dict[str, Any]:
-        return self._make_request('PUT', f'/api/v1/transactions/{transaction_id}/recategorize')
+        result = self._make_request('PUT', f'/api/v1/transactions/{transaction_id}/recategorize')
+        self.flush_cache()
+        return result
     
     def get_ai_status(self) -> Dict[str, Any]:
         return self._make_request('GET', '/api/v1/ai/status')
@@ -168,13 +220,44 @@ class APIClient:
         return self.token is not None
     
     def get_transaction_summary(self) -> Dict[str, Any]:
-        return self._make_request('GET', '/api/v1/stats/summary')
+        return self._cached_get('/api/v1/stats/summary', ttl=15)
     
+    def get_dashboard_metrics(self) -> Dict[str, Any]:
+        """Aggregate the four dashboard card metrics from one summary call"""
+        summary = self.get_transaction_summary() or {}
+        data = summary.get('summary', summary)
+        return {
+            'total_income': data.get('total_income', 0),
+            'total_transactions': data.get('transaction_count', 0),
+            'categories_count': data.get('categories_count', 0),
+            'average_amount': data.get('average_amount', 0),
+        }
+
+    def get_reports_bundle(self) -> Dict[str, Any]:
+        """Fetch everything the reports page needs in one round-trip.
+
+        The /reports/bundle route composes monthly stats, category stats,
+        transactions and the transaction summary server-side, cutting four
+        RTTs to one. Backends that predate the route make the bundle fall
+        back to the individual endpoints, fetched concurrently.
+        """
+        try:
+            return self._cached_get('/api/v1/reports/bundle', ttl=15)
+        except Exception:
+            parts = self.get_many('get_monthly_stats', 'get_category_stats',
+                                  'get_transactions', 'get_transaction_summary')
+            return {
+                'monthly_stats': (parts['get_monthly_stats'] or {}).get('monthly_stats', []),
+                'category_stats': parts['get_category_stats'] or {},
+                'transactions': (parts['get_transactions'] or {}).get('transactions', []),
+                'transaction_summary': (parts['get_transaction_summary'] or {}).get('summary', {}),
+            }
+
     def get_monthly_stats(self) -> Dict[str, Any]:
-        return self._make_request('GET', '/api/v1/stats/monthly')
+        return self._cached_get('/api/v1/stats/monthly', ttl=15)
     
     def get_category_stats(self) -> Dict[str, Any]:
-        return self._make_request('GET', '/api/v1/categories/stats')
+        return self._cached_get('/api/v1/categories/stats', ttl=15)
     
     def suggest_categories(self, description: str) -> Dict[str, Any]:
         if not description.strip():
@@ -190,11 +273,15 @@ class APIClient:
     
     def batch_recategorize(self, transaction_ids: list) -> Dict[str, Any]:
         data = {"transaction_ids": transaction_ids}
-        return self._make_request('POST', '/api/v1/transactions/batch-recategorize', data)
+        result = self._make_request('POST', '/api/v1/transactions/batch-recategorize', data)
+        self.flush_cache()
+        return result
     
     def create_category(self, name: str) -> Dict[str, Any]:
         data = {"name": name}
-        return self._make_request('POST', '/api/v1/categories', data)
+        result = self._make_request('POST', '/api/v1/categories', data)
+        self.flush_cache()
+        return result
     
     def test_connection(self) -> bool:
         try:
@@ -0,0 +1,95 @@
+"""
+Shared card chrome for Finance Desktop Application
+One pre-rendered 9-slice drop shadow reused by every card-style frame
+"""
+
+from PyQt5.QtWidgets import QFrame
+from PyQt5.QtCore import Qt, QRect
+from PyQt5.QtGui import QBrush, QColor, QPainter, QPainterPath, QPixmap
+
+# Geometry of the pre-rendered card shadow. The margin is the transparent
+# ring around the white card body that the shadow fades out in.
+SHADOW_MARGIN = 10
+CARD_RADIUS = 12
+_SHADOW_SLICE = SHADOW_MARGIN + CARD_RADIUS
+_SHADOW_LAYER_COLOR = QColor(0, 0, 0, 4)
+_CARD_BODY_BRUSH = QBrush(QColor('#ffffff'))
+
+
+def _render_card_shadow():
+    """Render the soft card shadow once into a small 9-slice pixmap.
+
+    Approximates the old QGraphicsDropShadowEffect look by stacking
+    low-alpha rounded rects; the result is blitted instead of re-blurred
+    on every repaint.
+    """
+    size = 2 * _SHADOW_SLICE + 8
+    pm = QPixmap(size, size)
+    pm.fill(Qt.transparent)
+    painter = QPainter(pm)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(Qt.NoPen)
+    painter.setBrush(_SHADOW_LAYER_COLOR)
+    for i in range(SHADOW_MARGIN):
+        radius = CARD_RADIUS + (SHADOW_MARGIN - i) // 2
+        painter.drawRoundedRect(i, i + 1, size - 2 * i, size - 2 * i - 2,
+                                radius, radius)
+    painter.end()
+    return pm
+
+
+class CardFrame(QFrame):
+    """White rounded card that paints a cached drop shadow.
+
+    QGraphicsDropShadowEffect forces Qt onto a software render path and
+    re-blurs the whole card subtree on every repaint; drawing a shared
+    pre-rendered 9-slice pixmap gives the same look at blit cost.
+    """
+
+    _shadow_pm = None
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFrameStyle(QFrame.NoFrame)
+        if CardFrame._shadow_pm is None:
+            CardFrame._shadow_pm = _render_card_shadow()
+        # Keep child layouts off the shadow ring
+        self.setContentsMargins(SHADOW_MARGIN, SHADOW_MARGIN,
+                                SHADOW_MARGIN, SHADOW_MARGIN)
+        # Body path cached per size: building the rounded rect tessellation
+        # once per resize instead of once per paint
+        self._body_path = None
+
+    def resizeEvent(self, event):
+        self._body_path = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        pm = CardFrame._shadow_pm
+        s = _SHADOW_SLICE
+        w, h = self.width(), self.height()
+        pw, ph = pm.width(), pm.height()
+        painter = QPainter(self)
+        # 9-slice blit of the shadow: four corners, four stretched edges
+        painter.drawPixmap(QRect(0, 0, s, s), pm, QRect(0, 0, s, s))
+        painter.drawPixmap(QRect(w - s, 0, s, s), pm, QRect(pw - s, 0, s, s))
+        painter.drawPixmap(QRect(0, h - s, s, s), pm, QRect(0, ph - s, s, s))
+        painter.drawPixmap(QRect(w - s, h - s, s, s), pm,
+                           QRect(pw - s, ph - s, s, s))
+        painter.drawPixmap(QRect(s, 0, w - 2 * s, s), pm,
+                           QRect(s, 0, pw - 2 * s, s))
+        painter.drawPixmap(QRect(s, h - s, w - 2 * s, s), pm,
+                           QRect(s, ph - s, pw - 2 * s, s))
+        painter.drawPixmap(QRect(0, s, s, h - 2 * s), pm,
+                           QRect(0, s, s, ph - 2 * s))
+        painter.drawPixmap(QRect(w - s, s, s, h - 2 * s), pm,
+                           QRect(pw - s, s, s, ph - 2 * s))
+        # Card body on top of the shadow
+        if self._body_path is None:
+            m = SHADOW_MARGIN
+            path = QPainterPath()
+            path.addRoundedRect(m, m, w - 2 * m, h - 2 * m,
+                                CARD_RADIUS, CARD_RADIUS)
+            self._body_path = path
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillPath(self._body_path, _CARD_BODY_BRUSH)
@@ -3,89 +3,529 @@ Dashboard UI components for Finance Desktop Application
 Main dashboard with navigation and content areas
 """
 
-from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                           QStackedWidget, QListWidget, QListWidgetItem,
-                           QLabel, QPushButton, QFrame, QScrollArea,
-                           QGridLayout, QSizePolicy, QMessageBox, QGraphicsDropShadowEffect)
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QRect
-from PyQt5.QtGui import QFont, QIcon, QPalette, QColor, QPainter, QBrush, QPen
-import sys
-import os
+from __future__ import annotations
 
-# Add parent directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
+                           QStackedWidget, QButtonGroup,
+                           QLabel, QPushButton, QFrame, QScrollArea,
+                           QSizePolicy, QMessageBox)
+from PyQt5.QtCore import (Qt, QTimer, pyqtSignal, QPropertyAnimation, QRect,
+                          QEvent, QObject, QRunnable, QThreadPool)
+from PyQt5.QtGui import (QFont, QFontMetrics, QIcon, QPalette, QColor,
+                         QPainter, QBrush, QPen, QPixmap, QPixmapCache)
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import MappingProxyType
+import numpy as np
 
-from api.client import APIClient
 from utils.logger import log_user_action, log_app_event, log_window_event
-from .transactions import TransactionListWidget
+from .cards import CardFrame, SHADOW_MARGIN
 from .reports import ReportsPage
 
-class MetricCard(QFrame):
-    """Custom metric card widget"""
-    
+# TransactionListWidget (and api.client's requests stack behind it) is
+# imported lazily inside _mount_transactions_widget so importing this
+# module — e.g. from tests that never open the transactions page — does
+# not pay for the whole table stack. APIClient itself only appears in
+# annotations, which PEP 563 leaves unevaluated.
+
+# The whole window is styled by one sheet applied once in apply_styles.
+# Per-widget setStyleSheet calls each trigger their own style recalculation
+# and leave Qt merging dozens of tiny sheets per paint; widgets instead get
+# object names and the rules live here, scoped by #objectName selectors.
+_WINDOW_QSS = """
+    QWidget#dashboardSurface {
+        background-color: #f0f2f5;
+    }
+    QScrollArea#contentScroll {
+        background-color: transparent;
+    }
+    QStackedWidget#contentArea {
+        background-color: transparent;
+    }
+    #transparentPage {
+        background-color: transparent;
+    }
+
+    QFrame#sidebar {
+        background-color: #2c3e50;
+        border: none;
+    }
+    QWidget#user_container {
+        background-color: #34495e;
+    }
+    QLabel#avatarLabel {
+        color: #ecf0f1;
+        letter-spacing: 1px;
+    }
+    QLabel#userNameLabel {
+        color: #ffffff;
+        letter-spacing: 0.5px;
+    }
+    QLabel#userEmailLabel {
+        color: #95a5a6;
+    }
+    QLabel#userRoleLabel {
+        color: #7f8c8d;
+    }
+    QPushButton#refreshProfileBtn {
+        background: #3b5366;
+        color: #d0d7dd;
+        border: 1px solid #3f5a6f;
+        border-radius: 6px;
+        font-size: 11px;
+        font-weight: 500;
+        padding: 4px 10px;
+    }
+    QPushButton#refreshProfileBtn:hover { background:#46617a; color:#ffffff; }
+    QPushButton#refreshProfileBtn:pressed { background:#3a5269; }
+    QPushButton#logoutBtn {
+        background-color: transparent;
+        color: #95a5a6;
+        border: none;
+        padding: 18px 25px;
+        text-align: left;
+    }
+    QPushButton#logoutBtn:hover {
+        background-color: #34495e;
+        color: white;
+    }
+    QWidget#navWidget QPushButton {
+        background-color: transparent;
+        color: #bdc3c7;
+        border: none;
+        padding: 18px 25px;
+        text-align: left;
+        font-family: 'Open Sans';
+        font-size: 13px;
+    }
+    QWidget#navWidget QPushButton:hover {
+        background-color: #34495e;
+        color: white;
+    }
+    QWidget#navWidget QPushButton:checked {
+        background-color: #1a252f;
+        color: white;
+        border-left: 4px solid #3498db;
+    }
+
+    QLabel#pageTitle {
+        color: #2c3e50;
+    }
+    QLabel#cardHeading {
+        color: #2c3e50;
+    }
+    QLabel#mutedLabel {
+        color: #7f8c8d;
+    }
+    QLabel#placeholderSubtitle {
+        color: #7f8c8d;
+        margin-top: 10px;
+    }
+    QPushButton#checkBtn, QPushButton#checkBtnTall {
+        background-color: #f39c12;
+        color: white;
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-family: 'Open Sans';
+        font-size: 12px;
+        font-weight: 600;
+    }
+    QPushButton#checkBtnTall {
+        padding: 10px 16px;
+        margin-top: 10px;
+    }
+    QPushButton#checkBtn:hover, QPushButton#checkBtnTall:hover {
+        background-color: #e67e22;
+    }
+    QLabel#chartPlaceholder {
+        background-color: #f8f9fa;
+        border-radius: 8px;
+        color: #6c757d;
+        font-size: 14px;
+        font-family: 'Open Sans';
+    }
+    QLabel#legendLabel {
+        color: #6c757d;
+        padding: 5px 0;
+    }
+    QLabel#reportsTitle {
+        color: #1a202c;
+        margin-bottom: 10px;
+    }
+    QScrollArea#reportsScroll {
+        border: none;
+        background-color: transparent;
+    }
+    QScrollArea#reportsScroll QScrollBar:vertical {
+        background-color: #f1f5f9;
+        width: 8px;
+        border-radius: 4px;
+    }
+    QScrollArea#reportsScroll QScrollBar::handle:vertical {
+        background-color: #cbd5e1;
+        min-height: 20px;
+        border-radius: 4px;
+    }
+    QScrollArea#reportsScroll QScrollBar::handle:vertical:hover {
+        background-color: #94a3b8;
+    }
+    QLabel#cardTitle {
+        color: #1f2937;
+        margin-bottom: 15px;
+    }
+    QLabel#cardRow {
+        color: #4b5563;
+        margin: 3px 0;
+    }
+    QLabel#cardLoading {
+        color: #6b7280;
+    }
+"""
+
+
+# Font cache: QFont construction consults FontConfig and runs family
+# substitution every time, so resolve each (family, size, weight)
+# combination once for the whole module.
+_FONTS = {}
+
+
+def _font(family, size, weight=QFont.Normal):
+    key = (family, size, weight)
+    f = _FONTS.get(key)
+    if f is None:
+        f = _FONTS[key] = QFont(family, size, weight)
+    return f
+
+
+# Calendar resources. The month grid used to be 42 QLabels (7 headers +
+# 35 day cells), each with its own font resolve, style parse and layout
+# slot; the whole grid is now painted once into a pixmap and shown by a
+# single QLabel. Pixmaps are cached per (year, month) so a future month
+# switch recomputes lazily.
+_CAL_FONT = _font('Open Sans', 10)
+_HIGHLIGHT = frozenset({'3', '11', '18', '24'})
+_CAL_DAYS = ('S', 'M', 'T', 'W', 'T', 'F', 'S')
+_CAL_WEEKS = (
+    ('', '', '1', '2', '3', '4', '5'),
+    ('6', '7', '8', '9', '10', '11', '12'),
+    ('13', '14', '15', '16', '17', '18', '19'),
+    ('20', '21', '22', '23', '24', '25', '26'),
+    ('27', '28', '29', '30', '31', '', ''),
+)
+_CAL_CELL = 35  # px per grid cell, matches the old 30px labels + spacing
+_CAL_HDR_COLOR = QColor('#95a5a6')
+_CAL_TEXT_COLOR = QColor('#2c3e50')
+_CAL_CACHE = {}
+
+
+def _render_calendar():
+    """Paint the sample month grid once into a pixmap."""
+    width = 7 * _CAL_CELL
+    height = (1 + len(_CAL_WEEKS)) * _CAL_CELL
+    pm = QPixmap(width, height)
+    pm.fill(Qt.transparent)
+    painter = QPainter(pm)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setFont(_CAL_FONT)
+    painter.setPen(_CAL_HDR_COLOR)
+    for col, day in enumerate(_CAL_DAYS):
+        painter.drawText(QRect(col * _CAL_CELL, 0, _CAL_CELL, _CAL_CELL),
+                         Qt.AlignCenter, day)
+    for row, week in enumerate(_CAL_WEEKS, 1):
+        for col, date in enumerate(week):
+            if not date:
+                continue
+            rect = QRect(col * _CAL_CELL, row * _CAL_CELL,
+                         _CAL_CELL, _CAL_CELL)
+            if date in _HIGHLIGHT:
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(_CAL_TEXT_COLOR)
+                painter.drawEllipse(rect.adjusted(2, 2, -2, -2))
+                painter.setPen(Qt.white)
+            else:
+                painter.setPen(_CAL_TEXT_COLOR)
+            painter.drawText(rect, Qt.AlignCenter, date)
+    painter.end()
+    return pm
+
+
+def _calendar_pixmap(year, month):
+    pm = _CAL_CACHE.get((year, month))
+    if pm is None:
+        pm = _CAL_CACHE[(year, month)] = _render_calendar()
+    return pm
+
+# Static legend resources shared by the stats and wave-chart cards. One
+# rich-text label per legend replaces the per-entry label (and per-dot
+# label/layout) widgets.
+_LEGEND_HTML = '• Item 1<br/>• Item 2<br/>• Item 3<br/>• Item 4'
+_ITEM_FONT = _font('Open Sans', 11)
+_LEGEND_TEXT_COLOR = QColor('#6c757d')
+_WAVE_LEGEND_ENTRIES = (
+    (QColor('#f39c12'), 'Lorem ipsum'),
+    (QColor('#2c3e50'), 'Dolor Amet'),
+)
+
+# Emoji glyphs drawn by QLabel are re-shaped and re-rasterized on every
+# expose; pre-render each unique (char, size, color) once into
+# QPixmapCache and hand labels the pixmap instead.
+QPixmapCache.setCacheLimit(20 * 1024)
+
+
+def _render_glyph(ch, size, color):
+    font = _font('Open Sans', size)
+    metrics = QFontMetrics(font)
+    rect = metrics.boundingRect(ch)
+    pm = QPixmap(max(rect.width(), 1), max(metrics.height(), 1))
+    pm.fill(Qt.transparent)
+    painter = QPainter(pm)
+    painter.setFont(font)
+    painter.setPen(QColor(color))
+    painter.drawText(pm.rect(), Qt.AlignCenter, ch)
+    painter.end()
+    return pm
+
+
+def emoji_pixmap(ch, size, color='#000000'):
+    key = f"emoji:{ch}:{size}:{color}"
+    pm = QPixmapCache.find(key)
+    if pm is None:
+        pm = _render_glyph(ch, size, color)
+        QPixmapCache.insert(key, pm)
+    return pm
+
+
+# Report-card labels pick up cardTitle/cardRow/cardLoading rules from the
+# window sheet; QFont instances come from the _font cache.
+
+# Static lookup tables for the report cards, built once at import
+_METHOD_DISPLAY_NAMES = MappingProxyType({
+    'ai_prediction': '\U0001f916 AI Prediction',
+    'manual': '\U0001f464 Manual',
+    'default': '\u26a1 Default',
+})
+_RANK_EMOJIS = ('\U0001f947', '\U0001f948', '\U0001f949')
+
+# Monthly overview rendered as one rich-text block: a single QLabel paints
+# all four rows in one pass instead of four widgets each doing layout+paint.
+_MONTHLY_OVERVIEW_TMPL = (
+    "<div style='color: #059669; font-weight: 600; margin: 3px 0;'>"
+    "\U0001f4b0 Income: Rp {income:,.0f}</div>"
+    "<div style='color: #dc2626; font-weight: 600; margin: 3px 0;'>"
+    "\U0001f4b8 Expenses: Rp {expense:,.0f}</div>"
+    "<div style='color: {balance_color}; font-weight: 600; margin: 3px 0;'>"
+    "\U0001f4ca Balance: Rp {balance:,.0f}</div>"
+    "<div style='color: #4b5563; font-weight: 600; margin: 3px 0;'>"
+    "\U0001f9fe Transactions: {count}</div>")
+
+# How long a page's fetched data stays fresh before a revisit re-fetches.
+_PAGE_DATA_TTL = 60.0
+
+# Hover-prefetched report payloads are reused for this long.
+_PREFETCH_TTL = 30.0
+
+
+def _summarize_transactions(transactions):
+    """Aggregate the four dashboard metrics from a raw transaction list.
+
+    Client-side fallback for when the stats endpoint returns nothing:
+    sum, count and mean come from one vectorized pass over an amounts
+    array instead of a Python loop per metric.
+    """
+    if not transactions:
+        return {'total_income': 0, 'total_transactions': 0,
+                'categories_count': 0, 'average_amount': 0}
+    amounts = np.fromiter((t.get('amount') or 0 for t in transactions),
+                          dtype=np.float64, count=len(transactions))
+    categories = {t.get('category_id') for t in transactions} - {None}
+    return {
+        'total_income': float(amounts[amounts > 0].sum()),
+        'total_transactions': int(amounts.size),
+        'categories_count': len(categories),
+        'average_amount': float(amounts.mean()),
+    }
+
+
+@contextmanager
+def _batched_updates(layout):
+    """Suppress repaints on a layout's host widget while its rows are
+    rebuilt, so a burst of addWidget calls costs one geometry pass."""
+    host = layout.parentWidget()
+    if host is not None:
+        host.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        if host is not None:
+            host.setUpdatesEnabled(True)
+
+
+class ApiFetchWorker(QRunnable):
+    """Runs one blocking api_client call on a pool thread.
+
+    Results come back on the GUI thread through queued signal delivery so
+    the window never blocks on a network round-trip.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal(dict)
+        error = pyqtSignal(str)
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+        self.signals = ApiFetchWorker.Signals()
+
+    def run(self):
+        try:
+            result = self.fn()
+            self.signals.finished.emit(result if isinstance(result, dict) else {})
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class _WaveLegend(QWidget):
+    """Static two-entry chart legend painted directly.
+
+    The old implementation nested dot and text QLabels inside per-entry
+    layouts; two dots and two strings need one paintEvent, not six
+    widgets.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setFixedHeight(22)
+        # Left-anchored content never moves on resize, so Qt can keep the
+        # existing pixels and only ask us to paint newly exposed area
+        self.setAttribute(Qt.WA_StaticContents)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setFont(_ITEM_FONT)
+        metrics = painter.fontMetrics()
+        x = 0
+        for color, text in _WAVE_LEGEND_ENTRIES:
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(color)
+            painter.drawEllipse(x, (self.height() - 9) // 2, 9, 9)
+            x += 15
+            painter.setPen(_LEGEND_TEXT_COLOR)
+            width = metrics.horizontalAdvance(text)
+            painter.drawText(QRect(x, 0, width, self.height()),
+                             Qt.AlignLeft | Qt.AlignVCenter, text)
+            x += width + 30
+
+
+_METRIC_TITLE_COLOR = QColor('#8b95a7')
+_METRIC_VALUE_COLOR = QColor('#2c3e50')
+
+
+class MetricCard(CardFrame):
+    """Custom metric card widget.
+
+    Painted entirely in paintEvent — no child labels or layouts. The card
+    shows one icon, one title and one value, so two layouts, three QLabels
+    and three stylesheet parses per card were pure overhead; setValue
+    repaints only the value region.
+    """
+
     def __init__(self, title, value, icon, color="#007bff", parent=None):
         super().__init__(parent)
-        self.setFrameStyle(QFrame.NoFrame)
-        self.setFixedHeight(120)
+        self.setFixedHeight(132)
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
-        
-        # Apply shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(3)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        self.setGraphicsEffect(shadow)
-        
-        layout = QVBoxLayout()
-        layout.setContentsMargins(25, 20, 25, 20)
-        layout.setSpacing(8)
-        
-        # Title with icon
-        header_layout = QHBoxLayout()
-        header_layout.setSpacing(8)
-        
-        icon_label = QLabel(icon)
-        icon_label.setFont(QFont('Open Sans', 20))
-        icon_label.setStyleSheet(f"color: {color};")
-        
-        title_label = QLabel(title)
-        title_label.setFont(QFont('Open Sans', 11))
-        title_label.setStyleSheet("color: #8b95a7; font-weight: 500;")
-        
-        header_layout.addWidget(icon_label)
-        header_layout.addWidget(title_label)
-        header_layout.addStretch()
-        
+        # Display-only: keep the card out of mouse hit-testing entirely
+        self.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._title = title
+        self._value = value
+        self._icon_pm = emoji_pixmap(icon, 20, color)
+
+    def _value_rect(self):
+        left = SHADOW_MARGIN + 25
+        top = SHADOW_MARGIN + 20 + self._icon_pm.height() + 8
+        return QRect(left, top, self.width() - 2 * left,
+                     self.height() - top - SHADOW_MARGIN - 20)
+
+    def setValue(self, value):
+        if value != self._value:
+            self._value = value
+            # Dirty only the value region, not the whole card
+            self.update(self._value_rect())
+
+    def value(self):
+        return self._value
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        painter = QPainter(self)
+        left = SHADOW_MARGIN + 25
+        top = SHADOW_MARGIN + 20
+
+        # Icon + title row
+        painter.drawPixmap(left, top, self._icon_pm)
+        painter.setFont(_font('Open Sans', 11))
+        painter.setPen(_METRIC_TITLE_COLOR)
+        title_x = left + self._icon_pm.width() + 8
+        painter.drawText(QRect(title_x, top, self.width() - title_x - left,
+                               self._icon_pm.height()),
+                         Qt.AlignLeft | Qt.AlignVCenter, self._title)
+
         # Value
-        self.value_label = QLabel(value)
-        self.value_label.setFont(QFont('Open Sans', 24, QFont.Bold))
-        self.value_label.setStyleSheet(f"color: #2c3e50;")
-        
-        layout.addLayout(header_layout)
-        layout.addWidget(self.value_label)
-        
-        self.setLayout(layout)
-        self.setStyleSheet("""
-            MetricCard {
-                background-color: white;
-                border-radius: 12px;
-            }
-        """)
+        painter.setFont(_font('Open Sans', 24, QFont.Bold))
+        painter.setPen(_METRIC_VALUE_COLOR)
+        painter.drawText(self._value_rect(),
+                         Qt.AlignLeft | Qt.AlignVCenter, self._value)
 
 
-class DashboardWindow(QMainWindow):
-    """Main dashboard window"""
+class DashboardWindow(QWidget):
+    """Main dashboard window.
+
+    A plain QWidget: none of QMainWindow's menu/status/toolbar/dock
+    machinery is used, so its internal QMainWindowLayout and placeholder
+    widgets were pure overhead.
+    """
     
     logout_requested = pyqtSignal()
+    metricsReady = pyqtSignal(dict)
+
+    # Static navigation table: (icon glyph, page name, header title),
+    # indexed by both the button-group id and the stacked-widget index so
+    # the nav callback needs no per-event dict construction. Icons are
+    # rasterized once through emoji_pixmap instead of living in the button
+    # text, so hover/selection repaints never re-shape emoji glyphs.
+    _NAV_ITEMS = (
+        ('🏠', 'overview', 'Dashboard'),
+        ('💳', 'transactions', 'Transactions'),
+        ('✉️', 'messages', 'Messages'),
+        ('🔔', 'notifications', 'Notifications'),
+        ('📍', 'location', 'Location'),
+        ('📊', 'reports', 'Reports'),
+    )
     
     def __init__(self, api_client: APIClient, user_data: dict, parent=None):
         super().__init__(parent)
         self.api_client = api_client
         self.user_data = user_data
-        
-        print("DashboardWindow: Starting initialization...")
-        
+        self.pool = QThreadPool.globalInstance()
+        self._workers = []
+        # page name -> monotonic timestamp of the last successful load
+        self._page_loaded = {}
+        # layout key -> list of pooled row labels reused across refreshes
+        self._row_pools = {}
+        # page name -> (timestamp, payload) filled by hover prefetch
+        self._prefetch = {}
+        self._prefetch_future = None
+        self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        # endpoint name -> pending Future, so repeated navigations share
+        # one network call instead of stacking identical requests
+        self._api_executor = ThreadPoolExecutor(max_workers=4)
+        self._inflight = {}
+        # Built on first use, then reused so repeat logouts skip dialog
+        # construction and stylesheet parsing
+        self._logout_confirm = None
+
         try:
             log_window_event("DashboardWindow", "initializing", {
                 "user_id": user_data.get('id'),
@@ -93,56 +533,46 @@ class DashboardWindow(QMainWindow):
             })
             self.setAttribute(Qt.WA_QuitOnClose, False)
             self.setWindowFlags(Qt.Window)
+            self.metricsReady.connect(self.update_metrics_cards)
             
-            print("DashboardWindow: Calling initUI...")
             self.initUI()
             
-            print("DashboardWindow: Loading dashboard data...")
             self.load_dashboard_data()
             
             log_window_event("DashboardWindow", "initialization_complete")
-            print("DashboardWindow: Initialization complete")
             
         except Exception as e:
-            print(f"DashboardWindow: Error in init: {e}")
             log_window_event("DashboardWindow", "initialization_error", {"error": str(e)})
             raise
     
     def initUI(self):
         """Initialize dashboard UI"""
-        print("DashboardWindow: Setting window properties...")
         self.setWindowTitle('Dashboard - Finance Manager')
         self.setGeometry(100, 100, 1300, 750)
 
         self.setMinimumSize(1200, 700)
         self.setMaximumSize(1500, 900)
-        
-        # Ensure window is visible and on top
-        self.setWindowState(Qt.WindowNoState)
-        self.activateWindow()
-        self.raise_()
-        
-        print("DashboardWindow: Creating central widget...")
-        # Create central widget with background
-        central_widget = QWidget()
-        central_widget.setStyleSheet("background-color: #f0f2f5;")
-        self.setCentralWidget(central_widget)
-        
-        print("DashboardWindow: Creating main layout...")
+
+        # No activateWindow/raise_ here: the window is not shown yet, so
+        # each call is a wasted window-system round-trip. The caller's
+        # show() handles activation.
+
+        # The window is its own surface — no central-widget indirection
+        self.setObjectName("dashboardSurface")
+        self.setAttribute(Qt.WA_StyledBackground, True)
+
         # Main layout
-        main_layout = QHBoxLayout(central_widget)
+        main_layout = QHBoxLayout(self)
         main_layout.setSpacing(0)
         main_layout.setContentsMargins(0, 0, 0, 0)
         
-        print("DashboardWindow: Creating sidebar...")
         # Create sidebar
         self.create_sidebar()
         main_layout.addWidget(self.sidebar)
         
-        print("DashboardWindow: Creating content wrapper...")
         # Create content area with padding
         content_wrapper = QWidget()
-        content_wrapper.setStyleSheet("background-color: #f0f2f5;")
+        content_wrapper.setObjectName("dashboardSurface")
         content_layout = QVBoxLayout(content_wrapper)
         content_layout.setContentsMargins(15, 15, 15, 15)
         
@@ -156,7 +586,7 @@ class DashboardWindow(QMainWindow):
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
         scroll_area.setFrameStyle(QFrame.NoFrame)
-        scroll_area.setStyleSheet("background-color: transparent;")
+        scroll_area.setObjectName("contentScroll")
         
         # Create content area
         self.create_content_area()
@@ -167,12 +597,16 @@ class DashboardWindow(QMainWindow):
         
         # Apply styling
         self.apply_styles()
-        
-        # Connect navigation
-        self.nav_list.currentItemChanged.connect(self.on_nav_changed)
-        
+
+        # Coalesce rapid nav selections into a single page switch
+        self._nav_timer = QTimer(self)
+        self._nav_timer.setSingleShot(True)
+        self._nav_timer.setInterval(0)
+        self._nav_timer.timeout.connect(self._apply_nav)
+        self._pending_nav_index = 0
+
         # Set initial page
-        self.nav_list.setCurrentRow(0)
+        self.nav_buttons[0].setChecked(True)
         self.content_area.setCurrentWidget(self.overview_page)
     
     def create_sidebar(self):
@@ -180,12 +614,7 @@ class DashboardWindow(QMainWindow):
         self.sidebar = QFrame()
         self.sidebar.setFixedWidth(250)
         self.sidebar.setFrameStyle(QFrame.NoFrame)
-        self.sidebar.setStyleSheet("""
-            QFrame {
-                background-color: #2c3e50;
-                border: none;
-            }
-        """)
+        self.sidebar.setObjectName("sidebar")
         
         self.sidebar_layout = QVBoxLayout(self.sidebar)
         self.sidebar_layout.setSpacing(0)
@@ -193,11 +622,6 @@ class DashboardWindow(QMainWindow):
         
         user_container = QWidget()
         user_container.setObjectName("user_container")
-        user_container.setStyleSheet("""
-            QWidget#user_container { 
-                background-color: #34495e; 
-            }
-        """)
         user_layout = QVBoxLayout(user_container)
         user_layout.setSpacing(10)
         user_layout.setContentsMargins(18, 18, 18, 18)
@@ -213,22 +637,17 @@ class DashboardWindow(QMainWindow):
         self.avatar_label = QLabel(initials)
         self.avatar_label.setFixedSize(68, 68)
         self.avatar_label.setAlignment(Qt.AlignCenter)
-        self.avatar_label.setFont(QFont('Open Sans', 26, QFont.Bold))
-        self.avatar_label.setStyleSheet("""
-            QLabel { 
-                color: #ecf0f1; 
-                letter-spacing: 1px; 
-            }
-        """)
+        self.avatar_label.setFont(_font('Open Sans', 26, QFont.Bold))
+        self.avatar_label.setObjectName("avatarLabel")
         avatar_layout.addWidget(self.avatar_label)
         user_layout.addWidget(avatar_wrapper, 0, Qt.AlignCenter)
 
         # Proper case name
         display_name = ' '.join([w.capitalize() for w in name_parts]) if name_parts else 'User'
         self.user_name_label = QLabel(display_name)
-        self.user_name_label.setFont(QFont('Open Sans', 14, QFont.DemiBold))
+        self.user_name_label.setFont(_font('Open Sans', 14, QFont.DemiBold))
         self.user_name_label.setAlignment(Qt.AlignCenter)
-        self.user_name_label.setStyleSheet("color: #ffffff; letter-spacing: 0.5px;")
+        self.user_name_label.setObjectName("userNameLabel")
         user_layout.addWidget(self.user_name_label)
 
         raw_email = self.user_data.get('email') or self.user_data.get('username') or 'user@example.com'
@@ -236,35 +655,23 @@ class DashboardWindow(QMainWindow):
         if len(raw_email) > 28:
             email_display = raw_email[:12] + '…' + raw_email[-12:]
         self.user_email_label = QLabel(email_display)
-        self.user_email_label.setFont(QFont('Open Sans', 10))
+        self.user_email_label.setFont(_font('Open Sans', 10))
         self.user_email_label.setAlignment(Qt.AlignCenter)
-        self.user_email_label.setStyleSheet("color: #95a5a6;")
+        self.user_email_label.setObjectName("userEmailLabel")
         self.user_email_label.setToolTip(raw_email)
         user_layout.addWidget(self.user_email_label)
 
         self.user_role_label = QLabel("")
-        self.user_role_label.setFont(QFont('Open Sans', 9))
+        self.user_role_label.setFont(_font('Open Sans', 9))
         self.user_role_label.setAlignment(Qt.AlignCenter)
-        self.user_role_label.setStyleSheet("color: #7f8c8d;")
+        self.user_role_label.setObjectName("userRoleLabel")
         self.user_role_label.setVisible(False)
         user_layout.addWidget(self.user_role_label)
 
         self.refresh_profile_btn = QPushButton("↻ Refresh Profile")
         self.refresh_profile_btn.setCursor(Qt.PointingHandCursor)
         self.refresh_profile_btn.setFixedHeight(30)
-        self.refresh_profile_btn.setStyleSheet("""
-            QPushButton { 
-                background: #3b5366; 
-                color: #d0d7dd; 
-                border: 1px solid #3f5a6f; 
-                border-radius: 6px; 
-                font-size: 11px; 
-                font-weight: 500; 
-                padding: 4px 10px; 
-            }
-            QPushButton:hover { background:#46617a; color:#ffffff; }
-            QPushButton:pressed { background:#3a5269; }
-        """)
+        self.refresh_profile_btn.setObjectName("refreshProfileBtn")
         self.refresh_profile_btn.clicked.connect(self.refresh_profile_data)
         user_layout.addWidget(self.refresh_profile_btn, 0, Qt.AlignCenter)
 
@@ -272,21 +679,10 @@ class DashboardWindow(QMainWindow):
         self._init_nav_list(self.sidebar_layout)
 
         # Logout button
-        self.logout_btn = QPushButton('🚪  Logout')
-        self.logout_btn.setFont(QFont('Open Sans', 12))
-        self.logout_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #95a5a6;
-                border: none;
-                padding: 18px 25px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #34495e;
-                color: white;
-            }
-        """)
+        self.logout_btn = QPushButton('Logout')
+        self.logout_btn.setIcon(QIcon(emoji_pixmap('🚪', 18, '#95a5a6')))
+        self.logout_btn.setFont(_font('Open Sans', 12))
+        self.logout_btn.setObjectName("logoutBtn")
         self.logout_btn.clicked.connect(self.logout)
         self.sidebar_layout.addWidget(self.logout_btn)
 
@@ -318,107 +714,121 @@ class DashboardWindow(QMainWindow):
             pass
 
     def _init_nav_list(self, sidebar_layout):
-        self.nav_list = QListWidget()
-        self.nav_list.setFrameStyle(QFrame.NoFrame)
-        self.nav_list.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
-        self.nav_list.setStyleSheet("""
-            QListWidget {
-                background-color: transparent;
-                border: none;
-                outline: none;
-            }
-            QListWidget::item {
-                color: #bdc3c7;
-                padding: 18px 25px;
-                border: none;
-                font-family: 'Open Sans';
-                font-size: 13px;
-            }
-            QListWidget::item:selected {
-                background-color: #1a252f;
-                color: white;
-                border-left: 4px solid #3498db;
-            }
-            QListWidget::item:hover {
-                background-color: #34495e;
-                color: white;
-            }
-        """)
-        nav_items = [
-            ('🏠  Dashboard', 'overview'),
-            ('�  Transactions', 'transactions'),
-            ('✉️  Messages', 'messages'),
-            ('🔔  Notifications', 'notifications'),
-            ('📍  Location', 'location'),
-            ('📊  Reports', 'reports')
-        ]
-        for text, data in nav_items:
-            item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, data)
-            item.setFont(QFont('Open Sans', 13))
-            self.nav_list.addItem(item)
-        sidebar_layout.addWidget(self.nav_list)
+        # A QListWidget is heavyweight for a static six-item nav: it drags
+        # in a model, a selection model and per-item allocations. Checkable
+        # flat buttons in an exclusive QButtonGroup give the same UX.
+        nav_widget = QWidget()
+        nav_widget.setObjectName("navWidget")
+        nav_layout = QVBoxLayout(nav_widget)
+        nav_layout.setSpacing(0)
+        nav_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.nav_group = QButtonGroup(self)
+        self.nav_group.setExclusive(True)
+        self.nav_buttons = []
+        for i, (icon, _, title) in enumerate(self._NAV_ITEMS):
+            btn = QPushButton(title)
+            btn.setIcon(QIcon(emoji_pixmap(icon, 18, '#bdc3c7')))
+            btn.setCheckable(True)
+            btn.setFlat(True)
+            btn.setCursor(Qt.PointingHandCursor)
+            self.nav_group.addButton(btn, i)
+            self.nav_buttons.append(btn)
+            nav_layout.addWidget(btn)
+        nav_layout.addStretch()
+
+        self.nav_group.buttonClicked[int].connect(self.on_nav_changed_idx)
+
+        # Hovering "Reports" usually precedes clicking it: start the fetch
+        # on pointer enter so the data is (mostly) there by the click.
+        self._reports_btn = self.nav_buttons[-1]
+        self._reports_btn.installEventFilter(self)
+
+        sidebar_layout.addWidget(nav_widget, stretch=1)
         
         
     
     def create_header(self):
         """Create header with title"""
-        self.header_widget = QWidget()
-        self.header_widget.setFixedHeight(70)
-        self.header_widget.setStyleSheet("""
-            QWidget {
-                background-color: white;
-                border-radius: 14px;
-            }
-        """)
-        
-        # Add shadow
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setXOffset(0)
-        shadow.setYOffset(2)
-        shadow.setColor(QColor(0, 0, 0, 20))
-        self.header_widget.setGraphicsEffect(shadow)
-        
+        self.header_widget = CardFrame()
+        self.header_widget.setFixedHeight(90)
+
         header_layout = QHBoxLayout(self.header_widget)
         header_layout.setContentsMargins(24, 12, 24, 12)
         
         # Title
         self.page_title = QLabel('Dashboard')
-        self.page_title.setFont(QFont('Open Sans', 22, QFont.Bold))
-        self.page_title.setStyleSheet("color: #2c3e50;")
+        self.page_title.setFont(_font('Open Sans', 22, QFont.Bold))
+        self.page_title.setObjectName("pageTitle")
         header_layout.addWidget(self.page_title)
         header_layout.addStretch()
     
     def create_content_area(self):
         """Create main content area"""
         self.content_area = QStackedWidget()
-        self.content_area.setStyleSheet("background-color: transparent;")
-        
-        # Create pages
-        self.overview_page = self.create_overview_page()
-        self.transactions_page = self.create_transactions_page()
-        self.messages_page = self.create_placeholder_page('✉️ Messages', 'Messaging features coming soon')
-        self.notifications_page = self.create_placeholder_page('🔔 Notifications', 'Notifications coming soon')
-        self.location_page = self.create_placeholder_page('📍 Location', 'Location features coming soon')
-        self.reports_page = ReportsPage(self.api_client)
-        
-        # Add pages
-        self.content_area.addWidget(self.overview_page)
-        self.content_area.addWidget(self.transactions_page)
-        self.content_area.addWidget(self.messages_page)
-        self.content_area.addWidget(self.notifications_page)
-        self.content_area.addWidget(self.location_page)
-        self.content_area.addWidget(self.reports_page)
+        self.content_area.setObjectName("contentArea")
+
+        # Every addWidget below would otherwise trigger its own geometry
+        # pass; batch them into one by suppressing updates while the pages
+        # are assembled.
+        self.setUpdatesEnabled(False)
+        try:
+            self._create_pages()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _create_pages(self):
+        # Only the landing page is built eagerly; the rest are created on
+        # first navigation and cached, so startup never pays for tabs the
+        # user may not open.
+        self._page_factories = {
+            'overview': self.create_overview_page,
+            'transactions': self.create_transactions_page,
+            'messages': lambda: self.create_placeholder_page('✉️ Messages', 'Messaging features coming soon'),
+            'notifications': lambda: self.create_placeholder_page('🔔 Notifications', 'Notifications coming soon'),
+            'location': lambda: self.create_placeholder_page('📍 Location', 'Location features coming soon'),
+            'reports': self._make_reports_page,
+        }
+        self._pages = {}
+        self.overview_page = self._ensure_page('overview')
+
+    def _make_reports_page(self):
+        page = ReportsPage(self.api_client)
+        page.loaded.connect(self._on_reports_loaded)
+        return page
+
+    def _on_reports_loaded(self, ok):
+        """Stamp the reports page fresh only after a successful load.
+
+        A failed fetch clears the entry instead, so the next visit
+        retries immediately rather than waiting out _PAGE_DATA_TTL on
+        error labels (the page has no manual refresh).
+        """
+        if ok:
+            self._page_loaded['reports'] = time.monotonic()
+        else:
+            self._page_loaded.pop('reports', None)
+
+    def _ensure_page(self, page_name):
+        """Return the page widget, building and mounting it on first use"""
+        page = self._pages.get(page_name)
+        if page is None:
+            page = self._page_factories[page_name]()
+            self._pages[page_name] = page
+            setattr(self, f"{page_name}_page", page)
+            self.content_area.addWidget(page)
+        return page
     
     def create_overview_page(self):
         """Create overview page with metrics"""
         page = QWidget()
-        page.setStyleSheet("background-color: transparent;")
+        page.setObjectName("transparentPage")
         layout = QVBoxLayout(page)
         layout.setContentsMargins(0, 20, 0, 0)
         layout.setSpacing(25)
-        
+        # Defer relayout until the page is fully assembled.
+        layout.setEnabled(False)
+
         # Metrics cards row
         cards_layout = QHBoxLayout()
         cards_layout.setSpacing(20)
@@ -460,27 +870,13 @@ class DashboardWindow(QMainWindow):
         bottom_layout.addWidget(calendar_widget, 1)
         
         layout.addLayout(bottom_layout)
-        
+        layout.setEnabled(True)
+
         return page
-    
+
     def create_result_chart(self):
         """Create bar chart widget"""
-        widget = QFrame()
-        widget.setFrameStyle(QFrame.NoFrame)
-        widget.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 12px;
-                padding: 10px;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(2)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        widget.setGraphicsEffect(shadow)
+        widget = CardFrame()
         
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(20, 20, 20, 20)
@@ -489,25 +885,11 @@ class DashboardWindow(QMainWindow):
         header_layout = QHBoxLayout()
         
         title = QLabel('Result')
-        title.setFont(QFont('Open Sans', 16, QFont.Bold))
-        title.setStyleSheet("color: #2c3e50;")
-        
+        title.setFont(_font('Open Sans', 16, QFont.Bold))
+        title.setObjectName("cardHeading")
+
         check_btn = QPushButton('Check Now')
-        check_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-family: 'Open Sans';
-                font-size: 12px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-            }
-        """)
+        check_btn.setObjectName("checkBtn")
         
         header_layout.addWidget(title)
         header_layout.addStretch()
@@ -519,13 +901,7 @@ class DashboardWindow(QMainWindow):
         chart_label = QLabel('📊 Monthly Performance Chart')
         chart_label.setAlignment(Qt.AlignCenter)
         chart_label.setMinimumHeight(200)
-        chart_label.setStyleSheet("""
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            color: #6c757d;
-            font-size: 14px;
-            font-family: 'Open Sans';
-        """)
+        chart_label.setObjectName("chartPlaceholder")
         
         layout.addWidget(chart_label)
         
@@ -533,21 +909,7 @@ class DashboardWindow(QMainWindow):
     
     def create_stats_widget(self):
         """Create stats widget"""
-        widget = QFrame()
-        widget.setFrameStyle(QFrame.NoFrame)
-        widget.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 12px;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(3)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        widget.setGraphicsEffect(shadow)
+        widget = CardFrame()
         
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(25, 25, 25, 25)
@@ -555,36 +917,21 @@ class DashboardWindow(QMainWindow):
         # Percentage
         percent_label = QLabel('45%')
         percent_label.setAlignment(Qt.AlignCenter)
-        percent_label.setFont(QFont('Open Sans', 36, QFont.Bold))
-        percent_label.setStyleSheet("color: #2c3e50;")
+        percent_label.setFont(_font('Open Sans', 36, QFont.Bold))
+        percent_label.setObjectName("cardHeading")
         
         layout.addWidget(percent_label)
         
         # Legend items
-        for i in range(4):
-            item = QLabel(f'• Item {i+1}')
-            item.setFont(QFont('Open Sans', 11))
-            item.setStyleSheet("color: #6c757d; padding: 5px 0;")
-            layout.addWidget(item)
+        legend = QLabel(_LEGEND_HTML)
+        legend.setTextFormat(Qt.RichText)
+        legend.setFont(_ITEM_FONT)
+        legend.setObjectName("legendLabel")
+        layout.addWidget(legend)
         
         # Check button
         check_btn = QPushButton('Check Now')
-        check_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #f39c12;
-                color: white;
-                border: none;
-                border-radius: 6px;
-                padding: 10px 16px;
-                font-family: 'Open Sans';
-                font-size: 12px;
-                font-weight: 600;
-                margin-top: 10px;
-            }
-            QPushButton:hover {
-                background-color: #e67e22;
-            }
-        """)
+        check_btn.setObjectName("checkBtnTall")
         
         layout.addWidget(check_btn)
         
@@ -592,60 +939,22 @@ class DashboardWindow(QMainWindow):
     
     def create_wave_chart(self):
         """Create wave chart widget"""
-        widget = QFrame()
-        widget.setFrameStyle(QFrame.NoFrame)
-        widget.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 12px;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(2)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        widget.setGraphicsEffect(shadow)
-        
+        widget = CardFrame()
+        # No interactive children — skip the card during mouse hit-testing
+        widget.setAttribute(Qt.WA_TransparentForMouseEvents)
+
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(20, 12, 20, 20)  # Top margin lebih kecil
         layout.setSpacing(8)  # Spacing antara legend dan chart
         
-        # Legend
-        legend_layout = QHBoxLayout()
-        legend_layout.setSpacing(30)
-        
-        for color, text in [('#f39c12', 'Lorem ipsum'), ('#2c3e50', 'Dolor Amet')]:
-            item_layout = QHBoxLayout()
-            item_layout.setSpacing(8)
-            
-            dot = QLabel('●')
-            dot.setStyleSheet(f"color: {color}; font-size: 16px;")
-            
-            label = QLabel(text)
-            label.setFont(QFont('Open Sans', 11))
-            label.setStyleSheet("color: #6c757d;")
-            
-            item_layout.addWidget(dot)
-            item_layout.addWidget(label)
-            
-            legend_layout.addLayout(item_layout)
-        
-        legend_layout.addStretch()
-        layout.addLayout(legend_layout)
+        # Legend: one paint-only widget, no child labels
+        layout.addWidget(_WaveLegend())
         
         # Wave placeholder
         wave_label = QLabel('🌊 Wave Chart')
         wave_label.setAlignment(Qt.AlignCenter)
         wave_label.setMinimumHeight(180)
-        wave_label.setStyleSheet("""
-            background-color: #f8f9fa;
-            border-radius: 8px;
-            color: #6c757d;
-            font-size: 14px;
-            font-family: 'Open Sans';
-        """)
+        wave_label.setObjectName("chartPlaceholder")
         
         layout.addWidget(wave_label)
         
@@ -653,140 +962,97 @@ class DashboardWindow(QMainWindow):
     
     def create_calendar_widget(self):
         """Create calendar widget"""
-        widget = QFrame()
-        widget.setFrameStyle(QFrame.NoFrame)
-        widget.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 12px;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(3)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        widget.setGraphicsEffect(shadow)
-        
+        widget = CardFrame()
+        # No interactive children — skip the card during mouse hit-testing
+        widget.setAttribute(Qt.WA_TransparentForMouseEvents)
+
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(25, 25, 25, 25)
         
         # Calendar icon
-        calendar_label = QLabel('📅')
+        calendar_label = QLabel()
         calendar_label.setAlignment(Qt.AlignCenter)
-        calendar_label.setFont(QFont('Open Sans', 48))
+        calendar_label.setPixmap(emoji_pixmap('📅', 48))
         
         layout.addWidget(calendar_label)
         
         # Month
         month_label = QLabel('October 2025')
         month_label.setAlignment(Qt.AlignCenter)
-        month_label.setFont(QFont('Open Sans', 14, QFont.Bold))
-        month_label.setStyleSheet("color: #2c3e50;")
+        month_label.setFont(_font('Open Sans', 14, QFont.Bold))
+        month_label.setObjectName("cardHeading")
         
         layout.addWidget(month_label)
-        
-        # Calendar grid
-        grid = QGridLayout()
-        grid.setSpacing(5)
-        
-        # Days header
-        days = ['S', 'M', 'T', 'W', 'T', 'F', 'S']
-        for i, day in enumerate(days):
-            label = QLabel(day)
-            label.setAlignment(Qt.AlignCenter)
-            label.setFont(QFont('Open Sans', 10))
-            label.setStyleSheet("color: #95a5a6;")
-            grid.addWidget(label, 0, i)
-        
-        # Sample dates
-        dates = [
-            ['', '', '1', '2', '3', '4', '5'],
-            ['6', '7', '8', '9', '10', '11', '12'],
-            ['13', '14', '15', '16', '17', '18', '19'],
-            ['20', '21', '22', '23', '24', '25', '26'],
-            ['27', '28', '29', '30', '31', '', '']
-        ]
-        
-        for row, week in enumerate(dates, 1):
-            for col, date in enumerate(week):
-                if date:
-                    label = QLabel(date)
-                    label.setAlignment(Qt.AlignCenter)
-                    label.setFont(QFont('Open Sans', 10))
-                    label.setFixedSize(30, 30)
-                    
-                    if date in ['3', '11', '18', '24']:
-                        label.setStyleSheet("""
-                            background-color: #2c3e50;
-                            color: white;
-                            border-radius: 15px;
-                        """)
-                    else:
-                        label.setStyleSheet("color: #2c3e50;")
-                    
-                    grid.addWidget(label, row, col)
-        
-        layout.addLayout(grid)
-        
+
+        # Calendar grid: one label showing the pre-rendered month pixmap
+        grid_label = QLabel()
+        grid_label.setAlignment(Qt.AlignCenter)
+        grid_label.setPixmap(_calendar_pixmap(2025, 10))
+        layout.addWidget(grid_label)
+
         return widget
     
     def create_transactions_page(self):
+        # TransactionListWidget hits the network in its constructor, which
+        # would block dashboard init. Show a lightweight placeholder first
+        # and mount the real widget on the next event-loop turn (widgets
+        # must be created on the GUI thread, so only construction is
+        # deferred — its own worker handles the data fetch).
+        page = QStackedWidget()
+        page.setObjectName("transparentPage")
+
+        loading = QLabel('💳 Loading transactions…')
+        loading.setAlignment(Qt.AlignCenter)
+        loading.setFont(_font('Open Sans', 14))
+        loading.setObjectName("mutedLabel")
+        page.addWidget(loading)
+
+        QTimer.singleShot(0, lambda: self._mount_transactions_widget(page))
+        return page
+
+    def _mount_transactions_widget(self, page):
+        """Build the real transactions widget and swap it into the proxy"""
         try:
-            # Create TransactionListWidget which handles all transaction CRUD operations
+            from .transactions import TransactionListWidget
             transaction_widget = TransactionListWidget(self.api_client)
-            
+
             # Wrap in a container for consistent styling
-            page = QWidget()
-            page.setStyleSheet("background-color: transparent;")
-            layout = QVBoxLayout(page)
+            container = QWidget()
+            container.setObjectName("transparentPage")
+            layout = QVBoxLayout(container)
             layout.setContentsMargins(0, 20, 0, 0)
             layout.addWidget(transaction_widget)
-            
-            return page
-            
+
+            page.addWidget(container)
+            page.setCurrentWidget(container)
+
         except Exception as e:
             log_app_event("transactions_page_error", "DashboardWindow", {"error": str(e)})
             # Fallback to placeholder if there's an error
-            return self.create_placeholder_page('💳 Transactions', f'Error loading transactions: {str(e)}')
+            fallback = self.create_placeholder_page('💳 Transactions', f'Error loading transactions: {str(e)}')
+            page.addWidget(fallback)
+            page.setCurrentWidget(fallback)
     
     def create_reports_page(self):
         """Create comprehensive reports and analytics page"""
         try:
             page = QWidget()
-            page.setStyleSheet("background-color: transparent;")
+            page.setObjectName("transparentPage")
             main_layout = QVBoxLayout(page)
             main_layout.setContentsMargins(0, 20, 0, 0)
             main_layout.setSpacing(20)
-            
+            # Defer relayout until the page is fully assembled.
+            main_layout.setEnabled(False)
+
             # Page title
             title = QLabel("📊 Financial Reports & Analytics")
-            title.setFont(QFont('Segoe UI', 24, QFont.Bold))
-            title.setStyleSheet("color: #1a202c; margin-bottom: 10px;")
+            title.setFont(_font('Segoe UI', 24, QFont.Bold))
+            title.setObjectName("reportsTitle")
             main_layout.addWidget(title)
             
             # Create scroll area for all reports
             scroll = QScrollArea()
-            scroll.setStyleSheet("""
-                QScrollArea {
-                    border: none;
-                    background-color: transparent;
-                }
-                QScrollBar:vertical {
-                    background-color: #f1f5f9;
-                    width: 8px;
-                    border-radius: 4px;
-                }
-                QScrollBar::handle:vertical {
-                    background-color: #cbd5e1;
-                    min-height: 20px;
-                    border-radius: 4px;
-                }
-                QScrollBar::handle:vertical:hover {
-                    background-color: #94a3b8;
-                }
-            """)
+            scroll.setObjectName("reportsScroll")
             scroll.setWidgetResizable(True)
             scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
             
@@ -841,8 +1107,17 @@ class DashboardWindow(QMainWindow):
             content_layout.addStretch()
             
             scroll.setWidget(content_widget)
+            # With widgetResizable(True) every scroll event reflows the
+            # whole card tree; pin the content to a fixed size instead and
+            # track the viewport width from resizeEvent, so scrolling is a
+            # plain translation blit.
+            scroll.setWidgetResizable(False)
+            content_widget.adjustSize()
+            self._reports_scroll = scroll
+            self._reports_content = content_widget
             main_layout.addWidget(scroll)
-            
+            main_layout.setEnabled(True)
+
             # Load data for all cards
             self.load_reports_data()
             
@@ -855,36 +1130,24 @@ class DashboardWindow(QMainWindow):
     def create_placeholder_page(self, title: str, subtitle: str):
         """Create placeholder page"""
         page = QWidget()
-        page.setStyleSheet("background-color: transparent;")
+        page.setObjectName("transparentPage")
         layout = QVBoxLayout(page)
         layout.setContentsMargins(0, 20, 0, 0)
-        
-        card = QFrame()
-        card.setFrameStyle(QFrame.NoFrame)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-                border-radius: 12px;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(3)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        card.setGraphicsEffect(shadow)
-        
+
+        card = CardFrame()
+        # No interactive children — skip the card during mouse hit-testing
+        card.setAttribute(Qt.WA_TransparentForMouseEvents)
+
         card_layout = QVBoxLayout(card)
         card_layout.setContentsMargins(40, 40, 40, 40)
         
         title_label = QLabel(title)
-        title_label.setFont(QFont('Open Sans', 20, QFont.Bold))
-        title_label.setStyleSheet("color: #2c3e50;")
-        
+        title_label.setFont(_font('Open Sans', 20, QFont.Bold))
+        title_label.setObjectName("cardHeading")
+
         subtitle_label = QLabel(subtitle)
-        subtitle_label.setFont(QFont('Open Sans', 13))
-        subtitle_label.setStyleSheet("color: #7f8c8d; margin-top: 10px;")
+        subtitle_label.setFont(_font('Open Sans', 13))
+        subtitle_label.setObjectName("placeholderSubtitle")
         
         card_layout.addWidget(title_label)
         card_layout.addWidget(subtitle_label)
@@ -894,77 +1157,194 @@ class DashboardWindow(QMainWindow):
         
         return page
     
-    def on_nav_changed(self, current, previous):
-        """Handle navigation change"""
-        if current:
-            page_name = current.data(Qt.UserRole)
-            log_user_action("navigation_changed", "DashboardWindow", {"page": page_name})
-            
-            # Update page title
-            page_titles = {
-                'overview': 'Dashboard',
-                'transactions': 'Transactions',
-                'messages': 'Messages',
-                'notifications': 'Notifications',
-                'location': 'Location',
-                'reports': 'Reports'
-            }
-            self.page_title.setText(page_titles.get(page_name, 'Dashboard'))
-            
-            # Switch page
-            page_map = {
-                'overview': 0,
-                'transactions': 1,
-                'messages': 2,
-                'notifications': 3,
-                'location': 4,
-                'reports': 5
-            }
-            
-            if page_name in page_map:
-                self.content_area.setCurrentIndex(page_map[page_name])
-                
-                if page_name == 'reports' and hasattr(self, 'reports_page'):
-                    self.reports_page.load_all()
+    def on_nav_changed_idx(self, index):
+        """Handle navigation change.
+
+        Rapid navigation (key repeat, fast clicking) is coalesced through a
+        0-ms single-shot timer so only the final selection swaps the page —
+        each swap triggers show/hide on an entire page subtree.
+        """
+        if not 0 <= index < len(self._NAV_ITEMS):
+            return
+        self._pending_nav_index = index
+        self._nav_timer.start()
+
+    def _apply_nav(self):
+        """Apply the most recent pending navigation selection"""
+        index = self._pending_nav_index
+        _, page_name, title = self._NAV_ITEMS[index]
+        log_user_action("navigation_changed", "DashboardWindow", {"page": page_name})
+
+        # Update page title and switch page (building it on first visit).
+        # Updates stay disabled on the outgoing page so data refreshes
+        # landing on hidden pages (queued setText etc.) schedule no
+        # paint work until the page is shown again.
+        prev = self.content_area.currentWidget()
+        page = self._ensure_page(page_name)
+        self.page_title.setText(title)
+        if page is not prev:
+            page.setUpdatesEnabled(True)
+            self.content_area.setCurrentWidget(page)
+            if prev is not None:
+                prev.setUpdatesEnabled(False)
+
+        if page_name == 'reports':
+            # Fetch only when the page's data is missing or stale, not on
+            # every visit.
+            loaded_at = self._page_loaded.get(page_name)
+            if loaded_at is None or time.monotonic() - loaded_at >= _PAGE_DATA_TTL:
+                # _load_reports_page / the page's loaded signal stamp
+                # _page_loaded once the data actually arrives
+                self._load_reports_page()
     
-    def apply_styles(self):
-        """Apply global styles"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f2f5;
+    def eventFilter(self, obj, event):
+        if obj is getattr(self, '_reports_btn', None) and event.type() == QEvent.Enter:
+            self._prefetch_reports()
+        return super().eventFilter(obj, event)
+
+    def _api_future(self, name, fn):
+        """Submit an api_client call, deduplicating in-flight requests"""
+        future = self._inflight.get(name)
+        if future is not None and not future.done():
+            return future
+        future = self._api_executor.submit(fn)
+        self._inflight[name] = future
+        future.add_done_callback(
+            lambda _f, key=name: self._inflight.pop(key, None))
+        return future
+
+    def _prefetch_reports(self):
+        """Warm the reports payload in the background on nav hover"""
+        if self._prefetch_future is not None and not self._prefetch_future.done():
+            return
+        entry = self._prefetch.get('reports')
+        if entry and time.monotonic() - entry[0] < _PREFETCH_TTL:
+            return
+        self._prefetch_future = self._prefetch_executor.submit(
+            self._fetch_reports_payload)
+
+    def _fetch_reports_payload(self):
+        try:
+            monthly = self._api_future('monthly_stats', self.api_client.get_monthly_stats)
+            category = self._api_future('category_stats', self.api_client.get_category_stats)
+            transactions = self._api_future('transactions', self.api_client.get_transactions)
+            summary = self._api_future('transaction_summary', self.api_client.get_transaction_summary)
+            payload = {
+                'monthly': monthly.result(),
+                'category': category.result(),
+                'transactions': transactions.result(),
+                'summary': (summary.result() or {}).get('summary', {}),
             }
-        """)
+            self._prefetch['reports'] = (time.monotonic(), payload)
+        except Exception as e:
+            log_app_event("reports_prefetch_error", "DashboardWindow", {"error": str(e)})
+
+    def _load_reports_page(self):
+        """Populate the reports page, reusing a fresh hover prefetch"""
+        entry = self._prefetch.get('reports')
+        if entry and time.monotonic() - entry[0] < _PREFETCH_TTL:
+            payload = entry[1]
+            page = self.reports_page
+            # Summary rides along so the page never has to fetch it
+            # synchronously on the GUI thread
+            page.update_monthly_overview(payload['monthly'], payload.get('summary'))
+            page.update_monthly_trends(payload['monthly'])
+            page.update_category_distribution(payload['category'])
+            page.update_ai_stats(payload['category'])
+            page.update_top_categories(payload['category'])
+            page.update_recent_summary(payload['transactions'])
+            # Prefetched payloads are cached only on fetch success, so
+            # applying one counts as a fresh load
+            self._page_loaded['reports'] = time.monotonic()
+        else:
+            self.reports_page.load_all()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        # Keep the fixed-size reports content tracking the viewport width
+        scroll = getattr(self, '_reports_scroll', None)
+        if scroll is not None:
+            self._reports_content.setFixedWidth(scroll.viewport().width())
+
+    def apply_styles(self):
+        """Apply global styles once.
+
+        Setting the window stylesheet re-resolves styles on every child
+        widget, so this must not run again after construction; theme
+        switches go through set_theme instead.
+        """
+        if getattr(self, '_styles_applied', False):
+            return
+        self._styles_applied = True
+        self.setStyleSheet(_WINDOW_QSS)
+
+    def set_theme(self, qss):
+        """Explicitly swap the global stylesheet (user theme change)"""
+        self._styles_applied = True
+        self.setStyleSheet(qss)
     
     def load_dashboard_data(self):
         log_app_event("dashboard_data_load_started", "DashboardWindow")
-        try:
-            summary_data = self.api_client.get_transaction_summary()
-            self.update_metrics_cards(summary_data)
-        except Exception as e:
-            log_app_event("dashboard_summary_error", "DashboardWindow", {"error": str(e)})
-            print(f"Failed to load transaction summary: {e}")
+        # One aggregated payload fans out to all four metric cards; the
+        # fetch runs on the thread pool and delivers via queued signals.
+        self._submit_fetch(self._fetch_metrics, self.metricsReady)
+
+    def _fetch_metrics(self):
+        """Pool-thread fetch: server summary, or a client-side fallback.
+
+        When the stats endpoint comes back empty the metrics are derived
+        from the raw transaction list via _summarize_transactions, still
+        off the GUI thread.
+        """
+        metrics = self.api_client.get_dashboard_metrics()
+        if not any(metrics.values()):
+            data = self.api_client.get_transactions()
+            return _summarize_transactions(data.get('transactions') or [])
+        if not (metrics['categories_count'] or metrics['average_amount']):
+            # Backends that predate these summary fields leave both at 0;
+            # derive them from the (TTL-cached) transaction list instead
+            data = self.api_client.get_transactions()
+            derived = _summarize_transactions(data.get('transactions') or [])
+            metrics['categories_count'] = derived['categories_count']
+            metrics['average_amount'] = derived['average_amount']
+        return metrics
+
+    def _submit_fetch(self, fn, done_signal):
+        """Run an api_client callable on the pool, routing into done_signal"""
+        worker = ApiFetchWorker(fn)
+        worker.signals.finished.connect(done_signal, Qt.QueuedConnection)
+        worker.signals.error.connect(self._on_fetch_error, Qt.QueuedConnection)
+        self._workers.append(worker)
+        self.pool.start(worker)
+
+    def _on_fetch_error(self, message):
+        log_app_event("dashboard_summary_error", "DashboardWindow", {"error": message})
     
+    # Compiled once: live refreshes reuse the bound format method instead
+    # of re-parsing an f-string format spec per update
+    _fmt_idr = staticmethod("IDR {:,.0f}".format)
+
     def update_metrics_cards(self, summary_data):
         """Update metrics cards with real data"""
         try:
             if not summary_data:
                 return
-            
+
             # Update earnings card
             total_income = summary_data.get('total_income', 0)
-            self.earning_card.value_label.setText(f"IDR {total_income:,.0f}")
-            
+            self.earning_card.setValue(self._fmt_idr(total_income))
+
             # Update transaction count
             total_transactions = summary_data.get('total_transactions', 0)
-            self.share_card.value_label.setText(str(total_transactions))
-            
+            self.share_card.setValue(str(total_transactions))
+
             # Update categories count
             categories_count = summary_data.get('categories_count', 0)
-            self.likes_card.value_label.setText(str(categories_count))
-            
+            self.likes_card.setValue(str(categories_count))
+
             # Update average transaction amount
             avg_amount = summary_data.get('average_amount', 0)
-            self.rating_card.value_label.setText(f"IDR {avg_amount:,.0f}")
+            self.rating_card.setValue(self._fmt_idr(avg_amount))
             
             log_app_event("metrics_updated", "DashboardWindow", summary_data)
             
@@ -972,263 +1352,114 @@ class DashboardWindow(QMainWindow):
             log_app_event("metrics_update_error", "DashboardWindow", {"error": str(e)})
     
     
-    def create_monthly_overview_card(self):
-        """Create monthly overview summary card"""
-        card = QFrame()
-        card.setFrameStyle(QFrame.NoFrame)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(3)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        card.setGraphicsEffect(shadow)
-        
+    def _make_card(self, title_text, layout_attr, loading_text):
+        """Build one report card: title, a named rows layout, loading label.
+
+        The six report cards only differed in their title and the
+        attribute their rows layout is stored under, so one builder covers
+        them all.
+        """
+        card = CardFrame()
+
         layout = QVBoxLayout(card)
         layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Title
-        title = QLabel("📅 This Month Overview")
-        title.setFont(QFont('Segoe UI', 16, QFont.Bold))
-        title.setStyleSheet("color: #1f2937; margin-bottom: 15px;")
+
+        title = QLabel(title_text)
+        title.setFont(_font('Segoe UI', 16, QFont.Bold))
+        title.setObjectName("cardTitle")
         layout.addWidget(title)
-        
-        # Create labels for data
-        self.monthly_income_label = QLabel("Income: Loading...")
-        self.monthly_expense_label = QLabel("Expenses: Loading...")
-        self.monthly_balance_label = QLabel("Balance: Loading...")
-        self.monthly_transactions_label = QLabel("Transactions: Loading...")
-        
-        for label in [self.monthly_income_label, self.monthly_expense_label, 
-                     self.monthly_balance_label, self.monthly_transactions_label]:
-            label.setFont(QFont('Segoe UI', 12))
-            label.setStyleSheet("color: #4b5563; margin: 3px 0;")
-            layout.addWidget(label)
-        
+
+        rows_layout = QVBoxLayout()
+        setattr(self, layout_attr, rows_layout)
+        layout.addLayout(rows_layout)
+
+        loading_label = QLabel(loading_text)
+        loading_label.setFont(_font('Segoe UI', 11))
+        loading_label.setObjectName("cardLoading")
+        rows_layout.addWidget(loading_label)
+
         layout.addStretch()
         return card
-    
-    def create_category_distribution_card(self):
-        """Create category distribution card"""
-        card = QFrame()
-        card.setFrameStyle(QFrame.NoFrame)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(3)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        card.setGraphicsEffect(shadow)
-        
+
+    def create_monthly_overview_card(self):
+        """Create monthly overview summary card"""
+        card = CardFrame()
+
         layout = QVBoxLayout(card)
         layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Title
-        title = QLabel("🎯 Category Distribution")
-        title.setFont(QFont('Segoe UI', 16, QFont.Bold))
-        title.setStyleSheet("color: #1f2937; margin-bottom: 15px;")
+
+        title = QLabel("📅 This Month Overview")
+        title.setFont(_font('Segoe UI', 16, QFont.Bold))
+        title.setObjectName("cardTitle")
         layout.addWidget(title)
-        
-        # Container for category stats
-        self.category_stats_layout = QVBoxLayout()
-        layout.addLayout(self.category_stats_layout)
-        
-        # Loading placeholder
-        loading_label = QLabel("Loading category data...")
-        loading_label.setFont(QFont('Segoe UI', 11))
-        loading_label.setStyleSheet("color: #6b7280;")
-        self.category_stats_layout.addWidget(loading_label)
-        
+
+        # One rich-text label covers all four data rows
+        self.monthly_overview_label = QLabel("Loading monthly data...")
+        self.monthly_overview_label.setTextFormat(Qt.RichText)
+        self.monthly_overview_label.setFont(_font('Segoe UI', 12))
+        self.monthly_overview_label.setObjectName("cardRow")
+        layout.addWidget(self.monthly_overview_label)
+
         layout.addStretch()
         return card
-    
+
+    def create_category_distribution_card(self):
+        """Create category distribution card"""
+        return self._make_card("🎯 Category Distribution",
+                               'category_stats_layout',
+                               "Loading category data...")
+
     def create_monthly_trend_card(self):
         """Create monthly trend chart card"""
-        card = QFrame()
-        card.setFrameStyle(QFrame.NoFrame)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(3)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        card.setGraphicsEffect(shadow)
-        
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Title
-        title = QLabel("📈 Monthly Trends")
-        title.setFont(QFont('Segoe UI', 16, QFont.Bold))
-        title.setStyleSheet("color: #1f2937; margin-bottom: 15px;")
-        layout.addWidget(title)
-        
-        # Container for trend info
-        self.trend_info_layout = QVBoxLayout()
-        layout.addLayout(self.trend_info_layout)
-        
-        # Loading placeholder
-        loading_label = QLabel("Loading trend data...")
-        loading_label.setFont(QFont('Segoe UI', 11))
-        loading_label.setStyleSheet("color: #6b7280;")
-        self.trend_info_layout.addWidget(loading_label)
-        
-        layout.addStretch()
-        return card
-    
+        return self._make_card("📈 Monthly Trends",
+                               'trend_info_layout',
+                               "Loading trend data...")
+
     def create_ai_stats_card(self):
         """Create AI prediction statistics card"""
-        card = QFrame()
-        card.setFrameStyle(QFrame.NoFrame)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(3)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        card.setGraphicsEffect(shadow)
-        
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Title
-        title = QLabel("🤖 AI Categorization Stats")
-        title.setFont(QFont('Segoe UI', 16, QFont.Bold))
-        title.setStyleSheet("color: #1f2937; margin-bottom: 15px;")
-        layout.addWidget(title)
-        
-        # Container for AI stats
-        self.ai_stats_layout = QVBoxLayout()
-        layout.addLayout(self.ai_stats_layout)
-        
-        # Loading placeholder
-        loading_label = QLabel("Loading AI statistics...")
-        loading_label.setFont(QFont('Segoe UI', 11))
-        loading_label.setStyleSheet("color: #6b7280;")
-        self.ai_stats_layout.addWidget(loading_label)
-        
-        layout.addStretch()
-        return card
-    
+        return self._make_card("🤖 AI Categorization Stats",
+                               'ai_stats_layout',
+                               "Loading AI statistics...")
+
     def create_top_categories_card(self):
         """Create top spending categories card"""
-        card = QFrame()
-        card.setFrameStyle(QFrame.NoFrame)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(3)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        card.setGraphicsEffect(shadow)
-        
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Title
-        title = QLabel("🏆 Top Spending Categories")
-        title.setFont(QFont('Segoe UI', 16, QFont.Bold))
-        title.setStyleSheet("color: #1f2937; margin-bottom: 15px;")
-        layout.addWidget(title)
-        
-        # Container for top categories
-        self.top_categories_layout = QVBoxLayout()
-        layout.addLayout(self.top_categories_layout)
-        
-        # Loading placeholder
-        loading_label = QLabel("Loading top categories...")
-        loading_label.setFont(QFont('Segoe UI', 11))
-        loading_label.setStyleSheet("color: #6b7280;")
-        self.top_categories_layout.addWidget(loading_label)
-        
-        layout.addStretch()
-        return card
-    
+        return self._make_card("🏆 Top Spending Categories",
+                               'top_categories_layout',
+                               "Loading top categories...")
+
     def create_recent_summary_card(self):
         """Create recent transactions summary card"""
-        card = QFrame()
-        card.setFrameStyle(QFrame.NoFrame)
-        card.setStyleSheet("""
-            QFrame {
-                background-color: white;
-            }
-        """)
-        
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(15)
-        shadow.setXOffset(0)
-        shadow.setYOffset(3)
-        shadow.setColor(QColor(0, 0, 0, 30))
-        card.setGraphicsEffect(shadow)
-        
-        layout = QVBoxLayout(card)
-        layout.setContentsMargins(20, 20, 20, 20)
-        
-        # Title
-        title = QLabel("⏰ Recent Activity")
-        title.setFont(QFont('Segoe UI', 16, QFont.Bold))
-        title.setStyleSheet("color: #1f2937; margin-bottom: 15px;")
-        layout.addWidget(title)
-        
-        # Container for recent summary
-        self.recent_summary_layout = QVBoxLayout()
-        layout.addLayout(self.recent_summary_layout)
-        
-        # Loading placeholder
-        loading_label = QLabel("Loading recent activity...")
-        loading_label.setFont(QFont('Segoe UI', 11))
-        loading_label.setStyleSheet("color: #6b7280;")
-        self.recent_summary_layout.addWidget(loading_label)
-        
-        layout.addStretch()
-        return card
-    
+        return self._make_card("⏰ Recent Activity",
+                               'recent_summary_layout',
+                               "Loading recent activity...")
+
     def load_reports_data(self):
-        """Load all data for reports page"""
+        """Load all data for reports page.
+
+        The four report endpoints are independent network calls, so they
+        are dispatched in parallel and total latency collapses to the
+        slowest single request instead of the sum of all four.
+        """
         try:
-            # Load monthly stats
-            monthly_data = self.api_client.get_monthly_stats()
-            self.update_monthly_overview(monthly_data)
-            
-            # Load category stats
-            category_data = self.api_client.get_category_stats()
+            monthly_future = self._api_future('monthly_stats', self.api_client.get_monthly_stats)
+            category_future = self._api_future('category_stats', self.api_client.get_category_stats)
+            transactions_future = self._api_future('transactions', self.api_client.get_transactions)
+            summary_future = self._api_future('transaction_summary', self.api_client.get_transaction_summary)
+
+            self.update_monthly_overview(monthly_future.result(),
+                                         summary_future.result())
+
+            category_data = category_future.result()
             self.update_category_distribution(category_data)
             self.update_ai_stats(category_data)
             self.update_top_categories(category_data)
-            
-            # Load recent transactions for summary
-            transactions_data = self.api_client.get_transactions()
-            self.update_recent_summary(transactions_data)
-            
+
+            self.update_recent_summary(transactions_future.result())
+
         except Exception as e:
             log_app_event("load_reports_data_error", "DashboardWindow", {"error": str(e)})
     
-    def update_monthly_overview(self, data):
+    def update_monthly_overview(self, data, summary_data=None):
         """Update monthly overview card with data"""
         try:
             monthly_stats = data.get('monthly_stats', [])
@@ -1237,284 +1468,179 @@ class DashboardWindow(QMainWindow):
                 income = current_month.get('income', 0)
                 expense = current_month.get('expense', 0)
                 balance = current_month.get('balance', 0)
-                
-                # Get transaction count from summary
-                summary_data = self.api_client.get_transaction_summary()
+
+                # Transaction count comes from the summary fetched by the caller
+                if summary_data is None:
+                    summary_data = self.api_client.get_transaction_summary()
                 transaction_count = summary_data.get('summary', {}).get('transaction_count', 0)
                 
-                self.monthly_income_label.setText(f"💰 Income: Rp {income:,.0f}")
-                self.monthly_income_label.setStyleSheet("color: #059669; font-weight: 600; margin: 3px 0;")
-                
-                self.monthly_expense_label.setText(f"💸 Expenses: Rp {expense:,.0f}")
-                self.monthly_expense_label.setStyleSheet("color: #dc2626; font-weight: 600; margin: 3px 0;")
-                
-                balance_color = "#059669" if balance >= 0 else "#dc2626"
-                self.monthly_balance_label.setText(f"📊 Balance: Rp {balance:,.0f}")
-                self.monthly_balance_label.setStyleSheet(f"color: {balance_color}; font-weight: 600; margin: 3px 0;")
-                
-                self.monthly_transactions_label.setText(f"🧾 Transactions: {transaction_count}")
-                self.monthly_transactions_label.setStyleSheet("color: #4b5563; font-weight: 600; margin: 3px 0;")
+                self.monthly_overview_label.setText(_MONTHLY_OVERVIEW_TMPL.format(
+                    income=income, expense=expense, balance=balance,
+                    balance_color="#059669" if balance >= 0 else "#dc2626",
+                    count=transaction_count))
             else:
-                self.monthly_income_label.setText("💰 Income: Rp 0")
-                self.monthly_expense_label.setText("💸 Expenses: Rp 0")
-                self.monthly_balance_label.setText("📊 Balance: Rp 0")
-                self.monthly_transactions_label.setText("🧾 Transactions: 0")
-                
+                self.monthly_overview_label.setText(_MONTHLY_OVERVIEW_TMPL.format(
+                    income=0, expense=0, balance=0,
+                    balance_color="#059669", count=0))
+
         except Exception as e:
             log_app_event("update_monthly_overview_error", "DashboardWindow", {"error": str(e)})
     
+    def _row_pool(self, layout, count, key):
+        """Fixed pool of rich-text row labels for a report card.
+
+        Refreshes mutate setText/setVisible on pooled labels instead of
+        tearing the rows down with deleteLater and re-parsing stylesheets
+        on freshly built widgets.
+        """
+        pool = self._row_pools.get(key)
+        if pool is None:
+            # First refresh: drop the static loading label
+            while layout.count():
+                child = layout.takeAt(0)
+                if child.widget():
+                    child.widget().deleteLater()
+            pool = []
+            for _ in range(count):
+                label = QLabel()
+                label.setTextFormat(Qt.RichText)
+                label.setFont(_font('Segoe UI', 11))
+                label.setVisible(False)
+                layout.addWidget(label)
+                pool.append(label)
+            self._row_pools[key] = pool
+        return pool
+
+    @staticmethod
+    def _fill_rows(rows, texts, empty_text):
+        # setText is guarded so an unchanged row keeps its cached sizeHint
+        # and never dirties the layout; steady-state refreshes are no-ops.
+        if not texts:
+            texts = ["<span style='color:#9ca3af'>%s</span>" % empty_text]
+        for i, label in enumerate(rows):
+            if i < len(texts):
+                if label.text() != texts[i]:
+                    label.setText(texts[i])
+                label.setVisible(True)
+            else:
+                label.setVisible(False)
+
     def update_category_distribution(self, data):
         """Update category distribution card"""
         try:
-            # Clear existing widgets
-            while self.category_stats_layout.count():
-                child = self.category_stats_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-            
-            categories = data.get('category_distribution', [])
-            if categories:
-                for i, category in enumerate(categories[:5]):  # Top 5 categories
+            with _batched_updates(self.category_stats_layout):
+                rows = self._row_pool(self.category_stats_layout, 5, 'category_stats')
+                texts = []
+                for category in data.get('category_distribution', [])[:5]:
                     name = category.get('category_name', 'Unknown')
                     amount = abs(category.get('total_amount', 0))
                     count = category.get('transaction_count', 0)
-                    
-                    # Create category item
-                    item_widget = QWidget()
-                    item_layout = QHBoxLayout(item_widget)
-                    item_layout.setContentsMargins(0, 5, 0, 5)
-                    
-                    # Category info
-                    info_label = QLabel(f"{name}")
-                    info_label.setFont(QFont('Segoe UI', 11, QFont.Medium))
-                    info_label.setStyleSheet("color: #374151;")
-                    
-                    # Amount and count
-                    stats_label = QLabel(f"Rp {amount:,.0f} ({count} txn)")
-                    stats_label.setFont(QFont('Segoe UI', 10))
-                    stats_label.setStyleSheet("color: #6b7280;")
-                    stats_label.setAlignment(Qt.AlignRight)
-                    
-                    item_layout.addWidget(info_label)
-                    item_layout.addStretch()
-                    item_layout.addWidget(stats_label)
-                    
-                    self.category_stats_layout.addWidget(item_widget)
-            else:
-                no_data_label = QLabel("No category data available")
-                no_data_label.setFont(QFont('Segoe UI', 11))
-                no_data_label.setStyleSheet("color: #9ca3af;")
-                self.category_stats_layout.addWidget(no_data_label)
-                
+                    texts.append(
+                        f"<span style='color:#374151;font-weight:500'>{name}</span>"
+                        f" &nbsp;<span style='color:#6b7280'>Rp {amount:,.0f} ({count} txn)</span>")
+                self._fill_rows(rows, texts, "No category data available")
+
         except Exception as e:
             log_app_event("update_category_distribution_error", "DashboardWindow", {"error": str(e)})
-    
+
     def update_ai_stats(self, data):
         """Update AI statistics card"""
         try:
-            # Clear existing widgets
-            while self.ai_stats_layout.count():
-                child = self.ai_stats_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-            
-            prediction_methods = data.get('prediction_methods', [])
-            total_predictions = sum(method.get('count', 0) for method in prediction_methods)
-            
-            if prediction_methods and total_predictions > 0:
-                for method in prediction_methods:
-                    method_name = method.get('method', 'unknown')
-                    count = method.get('count', 0)
-                    percentage = (count / total_predictions) * 100 if total_predictions > 0 else 0
-                    
-                    # Method display names
-                    display_names = {
-                        'ai_prediction': '🤖 AI Prediction',
-                        'manual': '👤 Manual',
-                        'default': '⚡ Default'
-                    }
-                    display_name = display_names.get(method_name, method_name.title())
-                    
-                    # Create method item
-                    item_widget = QWidget()
-                    item_layout = QHBoxLayout(item_widget)
-                    item_layout.setContentsMargins(0, 3, 0, 3)
-                    
-                    method_label = QLabel(display_name)
-                    method_label.setFont(QFont('Segoe UI', 11))
-                    method_label.setStyleSheet("color: #374151;")
-                    
-                    stats_label = QLabel(f"{percentage:.1f}% ({count})")
-                    stats_label.setFont(QFont('Segoe UI', 10, QFont.Medium))
-                    stats_label.setStyleSheet("color: #6366f1;")
-                    stats_label.setAlignment(Qt.AlignRight)
-                    
-                    item_layout.addWidget(method_label)
-                    item_layout.addStretch()
-                    item_layout.addWidget(stats_label)
-                    
-                    self.ai_stats_layout.addWidget(item_widget)
-            else:
-                no_data_label = QLabel("No prediction data available")
-                no_data_label.setFont(QFont('Segoe UI', 11))
-                no_data_label.setStyleSheet("color: #9ca3af;")
-                self.ai_stats_layout.addWidget(no_data_label)
-                
+            with _batched_updates(self.ai_stats_layout):
+                rows = self._row_pool(self.ai_stats_layout, 5, 'ai_stats')
+                prediction_methods = data.get('prediction_methods', [])
+                total_predictions = sum(method.get('count', 0) for method in prediction_methods)
+
+                texts = []
+                if total_predictions > 0:
+                    for method in prediction_methods[:5]:
+                        method_name = method.get('method', 'unknown')
+                        count = method.get('count', 0)
+                        percentage = (count / total_predictions) * 100
+                        display_name = _METHOD_DISPLAY_NAMES.get(method_name, method_name.title())
+                        texts.append(
+                            f"<span style='color:#374151'>{display_name}</span>"
+                            f" &nbsp;<span style='color:#6366f1;font-weight:500'>{percentage:.1f}% ({count})</span>")
+                self._fill_rows(rows, texts, "No prediction data available")
+
         except Exception as e:
             log_app_event("update_ai_stats_error", "DashboardWindow", {"error": str(e)})
-    
+
     def update_top_categories(self, data):
         """Update top categories card"""
         try:
-            # Clear existing widgets
-            while self.top_categories_layout.count():
-                child = self.top_categories_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-            
-            categories = data.get('category_distribution', [])
-            if categories:
-                # Sort by total amount (descending)
-                sorted_categories = sorted(categories, key=lambda x: abs(x.get('total_amount', 0)), reverse=True)
-                
-                for i, category in enumerate(sorted_categories[:3]):  # Top 3
+            with _batched_updates(self.top_categories_layout):
+                rows = self._row_pool(self.top_categories_layout, 3, 'top_categories')
+                categories = data.get('category_distribution', [])
+                sorted_categories = sorted(
+                    categories, key=lambda x: abs(x.get('total_amount', 0)), reverse=True)
+
+                texts = []
+                for i, category in enumerate(sorted_categories[:3]):
                     name = category.get('category_name', 'Unknown')
                     amount = abs(category.get('total_amount', 0))
                     avg_amount = abs(category.get('avg_amount', 0))
-                    
-                    # Rank emoji
-                    rank_emojis = ['🥇', '🥈', '🥉']
-                    rank_emoji = rank_emojis[i] if i < 3 else '🏅'
-                    
-                    # Create ranking item
-                    item_widget = QWidget()
-                    item_layout = QVBoxLayout(item_widget)
-                    item_layout.setContentsMargins(0, 8, 0, 8)
-                    
-                    # Rank and category
-                    rank_layout = QHBoxLayout()
-                    rank_label = QLabel(f"{rank_emoji} {name}")
-                    rank_label.setFont(QFont('Segoe UI', 12, QFont.Bold))
-                    rank_label.setStyleSheet("color: #1f2937;")
-                    
-                    amount_label = QLabel(f"Rp {amount:,.0f}")
-                    amount_label.setFont(QFont('Segoe UI', 11, QFont.Medium))
-                    amount_label.setStyleSheet("color: #dc2626;")
-                    amount_label.setAlignment(Qt.AlignRight)
-                    
-                    rank_layout.addWidget(rank_label)
-                    rank_layout.addStretch()
-                    rank_layout.addWidget(amount_label)
-                    
-                    # Average info
-                    avg_label = QLabel(f"Avg: Rp {avg_amount:,.0f} per transaction")
-                    avg_label.setFont(QFont('Segoe UI', 9))
-                    avg_label.setStyleSheet("color: #6b7280; margin-left: 24px;")
-                    
-                    item_layout.addLayout(rank_layout)
-                    item_layout.addWidget(avg_label)
-                    
-                    self.top_categories_layout.addWidget(item_widget)
-                    
-                    # Add separator line except for last item
-                    if i < min(len(sorted_categories) - 1, 2):
-                        separator = QFrame()
-                        separator.setFrameShape(QFrame.HLine)
-                        separator.setStyleSheet("color: #e5e7eb; margin: 5px 0;")
-                        self.top_categories_layout.addWidget(separator)
-            else:
-                no_data_label = QLabel("No spending data available")
-                no_data_label.setFont(QFont('Segoe UI', 11))
-                no_data_label.setStyleSheet("color: #9ca3af;")
-                self.top_categories_layout.addWidget(no_data_label)
-                
+                    rank_emoji = _RANK_EMOJIS[i] if i < 3 else '🏅'
+                    texts.append(
+                        f"<span style='color:#1f2937;font-weight:700'>{rank_emoji} {name}</span>"
+                        f" &nbsp;<span style='color:#dc2626;font-weight:500'>Rp {amount:,.0f}</span><br/>"
+                        f"<span style='color:#6b7280;font-size:9pt'>Avg: Rp {avg_amount:,.0f} per transaction</span>")
+                self._fill_rows(rows, texts, "No spending data available")
+
         except Exception as e:
             log_app_event("update_top_categories_error", "DashboardWindow", {"error": str(e)})
-    
+
     def update_recent_summary(self, data):
         """Update recent activity summary"""
         try:
-            # Clear existing widgets
-            while self.recent_summary_layout.count():
-                child = self.recent_summary_layout.takeAt(0)
-                if child.widget():
-                    child.widget().deleteLater()
-            
-            transactions = data.get('transactions', [])
-            if transactions:
-                # Show recent 5 transactions
-                recent_transactions = transactions[:5]
-                
-                for transaction in recent_transactions:
+            with _batched_updates(self.recent_summary_layout):
+                rows = self._row_pool(self.recent_summary_layout, 5, 'recent_summary')
+                texts = []
+                for transaction in data.get('transactions', [])[:5]:
                     description = transaction.get('description', 'Unknown')
+                    if len(description) > 30:
+                        description = description[:30] + "..."
                     amount = transaction.get('amount', 0)
                     category = transaction.get('category_name', 'No Category')
-                    date = transaction.get('transaction_date', '')[:10]  # Just date part
-                    
-                    # Create transaction item
-                    item_widget = QWidget()
-                    item_layout = QVBoxLayout(item_widget)
-                    item_layout.setContentsMargins(0, 5, 0, 5)
-                    
-                    # Main info layout
-                    main_layout = QHBoxLayout()
-                    
-                    # Transaction info
-                    desc_label = QLabel(description[:30] + "..." if len(description) > 30 else description)
-                    desc_label.setFont(QFont('Segoe UI', 11, QFont.Medium))
-                    desc_label.setStyleSheet("color: #374151;")
-                    
-                    # Amount
+                    date = transaction.get('transaction_date', '')[:10]
+
                     amount_color = "#059669" if amount > 0 else "#dc2626"
                     amount_text = f"+Rp {amount:,.0f}" if amount > 0 else f"Rp {abs(amount):,.0f}"
-                    amount_label = QLabel(amount_text)
-                    amount_label.setFont(QFont('Segoe UI', 10, QFont.Bold))
-                    amount_label.setStyleSheet(f"color: {amount_color};")
-                    amount_label.setAlignment(Qt.AlignRight)
-                    
-                    main_layout.addWidget(desc_label)
-                    main_layout.addStretch()
-                    main_layout.addWidget(amount_label)
-                    
-                    # Category and date info
-                    details_label = QLabel(f"{category} • {date}")
-                    details_label.setFont(QFont('Segoe UI', 9))
-                    details_label.setStyleSheet("color: #6b7280;")
-                    
-                    item_layout.addLayout(main_layout)
-                    item_layout.addWidget(details_label)
-                    
-                    self.recent_summary_layout.addWidget(item_widget)
-            else:
-                no_data_label = QLabel("No recent transactions")
-                no_data_label.setFont(QFont('Segoe UI', 11))
-                no_data_label.setStyleSheet("color: #9ca3af;")
-                self.recent_summary_layout.addWidget(no_data_label)
-                
+                    texts.append(
+                        f"<span style='color:#374151;font-weight:500'>{description}</span>"
+                        f" &nbsp;<span style='color:{amount_color};font-weight:700'>{amount_text}</span><br/>"
+                        f"<span style='color:#6b7280;font-size:9pt'>{category} • {date}</span>")
+                self._fill_rows(rows, texts, "No recent transactions")
+
         except Exception as e:
             log_app_event("update_recent_summary_error", "DashboardWindow", {"error": str(e)})
 
     def ensure_visible(self):
+        # Raise once after the pending event queue drains instead of
+        # issuing show/state/activate/raise round-trips back to back.
+        QTimer.singleShot(0, self._force_visible)
+
+    def _force_visible(self):
         self.show()
-        self.setWindowState(Qt.WindowNoState)
         self.activateWindow()
         self.raise_()
-        print(f"Dashboard visibility: {self.isVisible()}")
-        print(f"Dashboard window state: {self.windowState()}")
         log_window_event("DashboardWindow", "forced_visible")
     
     def logout(self):
         """Handle logout"""
         log_user_action("logout_clicked", "DashboardWindow")
         
-        reply = QMessageBox.question(
-            self,
-            'Confirm Logout',
-            'Are you sure you want to logout?',
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No
-        )
-        
+        if self._logout_confirm is None:
+            self._logout_confirm = QMessageBox(
+                QMessageBox.Question,
+                'Confirm Logout',
+                'Are you sure you want to logout?',
+                QMessageBox.Yes | QMessageBox.No,
+                self
+            )
+            self._logout_confirm.setDefaultButton(QMessageBox.No)
+        reply = self._logout_confirm.exec_()
+
         if reply == QMessageBox.Yes:
             log_user_action("logout_confirmed", "DashboardWindow")
             self.logout_requested.emit()
@@ -1,32 +1,206 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QFrame, QLabel, QPushButton)
-from PyQt5.QtGui import QFont, QColor
-from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QGraphicsDropShadowEffect
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QScrollArea, QLabel, QPushButton)
+from PyQt5.QtGui import QFont
+from PyQt5.QtCore import (Qt, QObject, QRunnable, QThread, QThreadPool,
+                          QTimer, pyqtSignal)
+import numpy as np
+from functools import lru_cache
+from types import MappingProxyType
 
 from utils.logger import log_app_event
+from .cards import CardFrame
+
+_MONTH_NAMES = ('Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec')
+_AI_METHOD_NAMES = MappingProxyType({'ai_prediction': '\U0001f916 AI Prediction',
+                                    'manual': '\U0001f464 Manual',
+                                    'default': '\u26a1 Default'})
+# All row-label styling lives in one page stylesheet keyed by object
+# name, so refreshes never re-parse CSS per label (chunk7-4).
+_PAGE_QSS = (
+    "* { background-color: transparent; }"
+    " QLabel#reportsTitle { color: #1a202c; margin-bottom: 10px; }"
+    " QLabel#cardTitle { color: #1f2937; margin-bottom: 15px; }"
+    " QScrollArea#reportsScroll { border: none; background-color: transparent; }"
+    " QLabel#cardRow { color: #4b5563; margin: 3px 0; }"
+    " QLabel#incomeRow { color: #059669; font-weight: 600; margin: 3px 0; }"
+    " QLabel#expenseRow { color: #dc2626; font-weight: 600; margin: 3px 0; }"
+    " QLabel#balancePos { color: #059669; font-weight: 600; margin: 3px 0; }"
+    " QLabel#balanceNeg { color: #dc2626; font-weight: 600; margin: 3px 0; }"
+    " QLabel#txnRow { color: #4b5563; font-weight: 600; margin: 3px 0; }"
+    " QLabel#statRow { color: #374151; margin: 2px 0; }"
+    " QLabel#aiRow { color: #6366f1; margin: 2px 0; }"
+    " QLabel#topRow { color: #1f2937; margin: 3px 0; }"
+    " QLabel#noData { color: #9ca3af; }"
+    " QLabel#loadingRow { color: #6b7280; }")
+_MEDALS = ('\U0001f947', '\U0001f948', '\U0001f949')
+
+# Shared QFont instances (implicitly shared/CoW); constructing one per
+# label hits the font database every time.
+_FONT_PAGE_TITLE = QFont('Segoe UI', 24, QFont.Bold)
+_FONT_CARD_TITLE = QFont('Segoe UI', 16, QFont.Bold)
+_FONT_OVERVIEW = QFont('Segoe UI', 12)
+_FONT_ROW = QFont('Segoe UI', 11)
+_FONT_ROW_SMALL = QFont('Segoe UI', 10)
+
+
+@lru_cache(maxsize=256)
+def fmt_month(m):
+    """'2025-10' -> 'Oct 2025'. Cached: the same months recur on every
+    trends refresh, and hoisting avoids re-creating the closure per call."""
+    try:
+        y, mo = m.split('-', 1)
+        return f"{_MONTH_NAMES[int(mo)-1]} {y}"
+    except Exception:
+        return m
+
+
+# Recent-6 table markup, compiled once; rows render via str.format and a
+# single join instead of per-row f-string assembly.
+_ROW_TMPL = ("<tr><td style='padding:2px 8px'>{m}</td>"
+             "<td style='padding:2px 8px;text-align:right'>{i:,.0f}</td>"
+             "<td style='padding:2px 8px;text-align:right'>{e:,.0f}</td>"
+             "<td style='padding:2px 8px;text-align:right'>{b:,.0f}</td>"
+             "<td style='padding:2px 8px;text-align:right'>{s}{d:,.0f}</td></tr>")
+_TABLE_OPEN = ("<div style='margin-top:8px'><b>Recent 6 Months</b><br>"
+               "<table style='border-collapse:collapse;font-size:11px;color:#374151'>"
+               "<tr style='background:#f1f5f9'>"
+               "<th style='padding:2px 8px;text-align:left'>Month</th>"
+               "<th style='padding:2px 8px'>Income</th>"
+               "<th style='padding:2px 8px'>Expense</th>"
+               "<th style='padding:2px 8px'>Balance</th>"
+               "<th style='padding:2px 8px'>Δ Bal</th></tr>")
+
+
+def _to_float(v):
+    """Coerce to float, skipping the constructor when it already is one."""
+    return v if type(v) is float else float(v)
+
+
+def _extract_trend_row(item):
+    """Normalize one raw monthly record to (month, income, expense, balance).
+
+    Hoisted to module scope so the trends loop runs one call per record
+    instead of re-evaluating the .get()/or chains inline; returns None
+    for records without a usable month key.
+    """
+    m = item.get('month') or item.get('period') or item.get('date')
+    if not m:
+        return None
+    inc = _to_float(item.get('income') or item.get('total_income') or 0.0)
+    exp = _to_float(item.get('expense') or item.get('total_expense') or 0.0)
+    bal = _to_float(item.get('balance') or (inc - abs(exp)))
+    return m[:7], inc, exp, bal
+
+
+def _set_role(widget, name):
+    """Switch a widget's QSS object name, re-polishing only on change."""
+    if widget.objectName() != name:
+        widget.setObjectName(name)
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+
+def _clear_layout(layout):
+    """Remove and delete every widget in a layout.
+
+    Iterates in reverse so each takeAt pops from the tail instead of
+    shifting the remaining items down one slot per removal; setParent(None)
+    detaches immediately so doomed widgets never repaint.
+    """
+    for i in range(layout.count() - 1, -1, -1):
+        item = layout.takeAt(i)
+        widget = item.widget()
+        if widget is not None:
+            widget.setParent(None)
+            widget.deleteLater()
+
+
+class _RecentRowsBuilder(QRunnable):
+    """Formats recent-activity row HTML off the UI thread.
+
+    The UI slot only does setText on pooled labels; all string slicing,
+    sign/color decisions and number formatting happen in the pool thread.
+    """
+
+    class Signals(QObject):
+        finished = pyqtSignal(list)
+
+    def __init__(self, transactions):
+        super().__init__()
+        self.transactions = transactions
+        self.signals = _RecentRowsBuilder.Signals()
+
+    def run(self):
+        texts = []
+        for tx in self.transactions[:5]:
+            desc = tx.get('description', 'Unknown')
+            amount = tx.get('amount', 0)
+            cat = tx.get('category_name', 'No Category')
+            date = tx.get('transaction_date', '')[:10]
+            color = '#059669' if amount > 0 else '#dc2626'
+            sign = '+' if amount > 0 else ''
+            texts.append(f"{date} • {cat} • {desc[:28] + '...' if len(desc) > 28 else desc} — "
+                         f"<span style='color:{color};font-weight:600'>{sign}Rp {abs(amount):,.0f}</span>")
+        self.signals.finished.emit(texts)
+
+
+class ReportsLoader(QObject):
+    """Fetches the reports bundle on a worker thread.
+
+    Lives on a QThread owned by ReportsPage; run() blocks on the network
+    there and hands the payload back to the UI thread via finished.
+    """
+
+    finished = pyqtSignal(dict)
+
+    def __init__(self, api_client):
+        super().__init__()
+        self.api_client = api_client
+
+    def run(self):
+        try:
+            bundle = self.api_client.get_reports_bundle()
+        except Exception as e:
+            log_app_event("reports_load_error", "ReportsPage", {"error": str(e)})
+            bundle = {}
+        self.finished.emit(bundle)
+
 
 class ReportsPage(QWidget):
     """Standalone Reports Page extracted from DashboardWindow.
     Provides financial analytics cards and the simplified Monthly Trends (chart + recent 6 months table only).
     """
+
+    # True when a bundle was fetched and applied, False when the fetch
+    # came back empty or applying it failed; hosts use it to decide
+    # whether the page's data is actually fresh
+    loaded = pyqtSignal(bool)
     def __init__(self, api_client):
         super().__init__()
         self.api_client = api_client
-        self.setStyleSheet("background-color: transparent;")
+        self.setStyleSheet(_PAGE_QSS)
         self._build_ui()
+        # Fetching happens on a dedicated thread: the thread starts on
+        # load_all, the loader emits the bundle back to the UI thread,
+        # and _apply_all quits the thread so the next refresh can reuse it.
+        self._loading = False
+        self._loader = ReportsLoader(api_client)
+        self._loader_thread = QThread(self)
+        self._loader.moveToThread(self._loader_thread)
+        self._loader_thread.started.connect(self._loader.run)
+        self._loader.finished.connect(self._apply_all)
     
     def _build_ui(self):
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 20, 0, 0)
         main_layout.setSpacing(20)
         title = QLabel("📊 Financial Reports & Analytics")
-        title.setFont(QFont('Segoe UI', 24, QFont.Bold))
-        title.setStyleSheet("color: #1a202c; margin-bottom: 10px;")
+        title.setFont(_FONT_PAGE_TITLE)
+        title.setObjectName("reportsTitle")
         main_layout.addWidget(title)
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea{border:none;background:transparent;}")
+        scroll.setObjectName("reportsScroll")
         content_widget = QWidget()
         self.content_layout = QVBoxLayout(content_widget)
         self.content_layout.setSpacing(20)
@@ -51,149 +225,239 @@ class ReportsPage(QWidget):
     
     # Card factories
     def _card_frame(self):
-        card = QFrame(); card.setFrameStyle(QFrame.NoFrame)
-        card.setStyleSheet("QFrame{background:white;border-radius:12px;}")
-        shadow = QGraphicsDropShadowEffect(); shadow.setBlurRadius(15); shadow.setXOffset(0); shadow.setYOffset(3); shadow.setColor(QColor(0,0,0,30))
-        card.setGraphicsEffect(shadow)
-        return card
+        # CardFrame paints its own white body plus a pre-rendered 9-slice
+        # shadow, so no stylesheet or per-paint blur effect is needed.
+        return CardFrame()
     
     def _create_monthly_overview_card(self):
         card = self._card_frame(); layout = QVBoxLayout(card); layout.setContentsMargins(20,20,20,20)
-        title = QLabel("📅 This Month Overview"); title.setFont(QFont('Segoe UI',16,QFont.Bold)); title.setStyleSheet("color:#1f2937;margin-bottom:15px;"); layout.addWidget(title)
+        title = QLabel("📅 This Month Overview"); title.setFont(_FONT_CARD_TITLE); title.setObjectName("cardTitle"); layout.addWidget(title)
         self.monthly_income_label = QLabel("Income: Loading...")
         self.monthly_expense_label = QLabel("Expenses: Loading...")
         self.monthly_balance_label = QLabel("Balance: Loading...")
         self.monthly_transactions_label = QLabel("Transactions: Loading...")
         for lbl in [self.monthly_income_label,self.monthly_expense_label,self.monthly_balance_label,self.monthly_transactions_label]:
-            lbl.setFont(QFont('Segoe UI',12)); lbl.setStyleSheet("color:#4b5563;margin:3px 0;"); layout.addWidget(lbl)
+            lbl.setFont(_FONT_OVERVIEW); lbl.setObjectName("cardRow"); layout.addWidget(lbl)
         layout.addStretch(); return card
     
     def _create_category_distribution_card(self):
         card = self._card_frame(); layout = QVBoxLayout(card); layout.setContentsMargins(20,20,20,20)
-        title = QLabel("🎯 Category Distribution"); title.setFont(QFont('Segoe UI',16,QFont.Bold)); title.setStyleSheet("color:#1f2937;margin-bottom:15px;"); layout.addWidget(title)
+        title = QLabel("🎯 Category Distribution"); title.setFont(_FONT_CARD_TITLE); title.setObjectName("cardTitle"); layout.addWidget(title)
         self.category_stats_layout = QVBoxLayout(); layout.addLayout(self.category_stats_layout)
-        loading = QLabel("Loading category data..."); loading.setFont(QFont('Segoe UI',11)); loading.setStyleSheet("color:#6b7280;"); self.category_stats_layout.addWidget(loading)
+        self._category_rows = []
+        loading = QLabel("Loading category data..."); loading.setFont(_FONT_ROW); loading.setObjectName("loadingRow"); self.category_stats_layout.addWidget(loading)
         layout.addStretch(); return card
     
     def _create_monthly_trend_card(self):
         card = self._card_frame(); layout = QVBoxLayout(card); layout.setContentsMargins(20,20,20,20)
-        title = QLabel("📈 Monthly Trends"); title.setFont(QFont('Segoe UI',16,QFont.Bold)); title.setStyleSheet("color:#1f2937;margin-bottom:15px;"); layout.addWidget(title)
+        title = QLabel("📈 Monthly Trends"); title.setFont(_FONT_CARD_TITLE); title.setObjectName("cardTitle"); layout.addWidget(title)
         self.trend_info_layout = QVBoxLayout(); layout.addLayout(self.trend_info_layout)
-        loading = QLabel("Loading trend data..."); loading.setFont(QFont('Segoe UI',11)); loading.setStyleSheet("color:#6b7280;"); self.trend_info_layout.addWidget(loading)
+        # Chart and table are created once on first data and reused; only
+        # the axes are cleared/redrawn on refresh.
+        self._trend_fig = None; self._trend_ax = None; self._trend_canvas = None
+        self._trend_table = None
+        loading = QLabel("Loading trend data..."); loading.setFont(_FONT_ROW); loading.setObjectName("loadingRow"); self.trend_info_layout.addWidget(loading)
         layout.addStretch(); return card
     
     def _create_ai_stats_card(self):
         card = self._card_frame(); layout = QVBoxLayout(card); layout.setContentsMargins(20,20,20,20)
-        title = QLabel("🤖 AI Categorization Stats"); title.setFont(QFont('Segoe UI',16,QFont.Bold)); title.setStyleSheet("color:#1f2937;margin-bottom:15px;"); layout.addWidget(title)
+        title = QLabel("🤖 AI Categorization Stats"); title.setFont(_FONT_CARD_TITLE); title.setObjectName("cardTitle"); layout.addWidget(title)
         self.ai_stats_layout = QVBoxLayout(); layout.addLayout(self.ai_stats_layout)
-        loading = QLabel("Loading AI statistics..."); loading.setFont(QFont('Segoe UI',11)); loading.setStyleSheet("color:#6b7280;"); self.ai_stats_layout.addWidget(loading)
+        self._ai_rows = []
+        loading = QLabel("Loading AI statistics..."); loading.setFont(_FONT_ROW); loading.setObjectName("loadingRow"); self.ai_stats_layout.addWidget(loading)
         layout.addStretch(); return card
     
     def _create_top_categories_card(self):
         card = self._card_frame(); layout = QVBoxLayout(card); layout.setContentsMargins(20,20,20,20)
-        title = QLabel("🏆 Top Spending Categories"); title.setFont(QFont('Segoe UI',16,QFont.Bold)); title.setStyleSheet("color:#1f2937;margin-bottom:15px;"); layout.addWidget(title)
+        title = QLabel("🏆 Top Spending Categories"); title.setFont(_FONT_CARD_TITLE); title.setObjectName("cardTitle"); layout.addWidget(title)
         self.top_categories_layout = QVBoxLayout(); layout.addLayout(self.top_categories_layout)
-        loading = QLabel("Loading top categories..."); loading.setFont(QFont('Segoe UI',11)); loading.setStyleSheet("color:#6b7280;"); self.top_categories_layout.addWidget(loading)
+        self._top_cat_rows = []
+        loading = QLabel("Loading top categories..."); loading.setFont(_FONT_ROW); loading.setObjectName("loadingRow"); self.top_categories_layout.addWidget(loading)
         layout.addStretch(); return card
     
     def _create_recent_summary_card(self):
         card = self._card_frame(); layout = QVBoxLayout(card); layout.setContentsMargins(20,20,20,20)
-        title = QLabel("⏰ Recent Activity"); title.setFont(QFont('Segoe UI',16,QFont.Bold)); title.setStyleSheet("color:#1f2937;margin-bottom:15px;"); layout.addWidget(title)
-        self.recent_summary_layout = QVBoxLayout(); layout.addLayout(self.recent_summary_layout)
-        loading = QLabel("Loading recent activity..."); loading.setFont(QFont('Segoe UI',11)); loading.setStyleSheet("color:#6b7280;"); self.recent_summary_layout.addWidget(loading)
+        title = QLabel("⏰ Recent Activity"); title.setFont(_FONT_CARD_TITLE); title.setObjectName("cardTitle"); layout.addWidget(title)
+        # Rows live in their own container and are pooled across refreshes
+        self.recent_summary_container = QWidget()
+        self.recent_summary_layout = QVBoxLayout(self.recent_summary_container)
+        self.recent_summary_layout.setContentsMargins(0, 0, 0, 0)
+        self._recent_rows = []
+        self._row_text_cache = {}
+        # Coalesce bursts of refresh requests (e.g. bulk import) into one
+        # rebuild 50 ms after the last trigger.
+        self._pending_recent_data = None
+        self._recent_refresh_timer = QTimer(self)
+        self._recent_refresh_timer.setSingleShot(True)
+        self._recent_refresh_timer.setInterval(50)
+        self._recent_refresh_timer.timeout.connect(self._do_update_recent_summary)
+        layout.addWidget(self.recent_summary_container)
+        loading = QLabel("Loading recent activity..."); loading.setFont(_FONT_ROW); loading.setObjectName("loadingRow"); self.recent_summary_layout.addWidget(loading)
         layout.addStretch(); return card
     
     # Data loading
-    def load_all(self):
+    def load_all(self, force_refresh=False):
+        # Kick off the worker-thread fetch; the "Loading..." placeholders
+        # stay interactive instead of the page blocking on the network.
+        # force_refresh bypasses the client's TTL cache for an explicit
+        # user-triggered reload.
+        if self._loading:
+            return
+        if force_refresh:
+            self.api_client.flush_cache()
+        self._loading = True
+        self._loader_thread.start()
+
+    def _apply_all(self, bundle):
+        # Back on the UI thread with the bundled payload; each update
+        # helper gets its slice.
+        self._loader_thread.quit()
+        self._loading = False
+        ok = bool(bundle)
         try:
-            monthly_data = self.api_client.get_monthly_stats(); self.update_monthly_overview(monthly_data); self.update_monthly_trends(monthly_data)
-            category_data = self.api_client.get_category_stats(); self.update_category_distribution(category_data); self.update_ai_stats(category_data); self.update_top_categories(category_data)
-            tx_data = self.api_client.get_transactions(); self.update_recent_summary(tx_data)
+            monthly_data = {'monthly_stats': bundle.get('monthly_stats') or []}
+            self.update_monthly_overview(monthly_data, bundle.get('transaction_summary') or {})
+            self.update_monthly_trends(monthly_data)
+            category_data = bundle.get('category_stats') or {}
+            self.update_category_distribution(category_data); self.update_ai_stats(category_data); self.update_top_categories(category_data)
+            self.update_recent_summary({'transactions': bundle.get('transactions') or []})
         except Exception as e:
             log_app_event("reports_load_error", "ReportsPage", {"error": str(e)})
+            ok = False
+        self.loaded.emit(ok)
+
+    def closeEvent(self, event):
+        self._loader_thread.quit()
+        self._loader_thread.wait()
+        super().closeEvent(event)
     
     # Update helpers
-    def update_monthly_overview(self, data):
+    def update_monthly_overview(self, data, summary=None):
         try:
             stats = data.get('monthly_stats', [])
             if stats:
                 cur = stats[0]
                 income = cur.get('income', 0); expense = cur.get('expense', 0); balance = cur.get('balance', 0)
-                summary = self.api_client.get_transaction_summary(); txn_count = summary.get('summary', {}).get('transaction_count', 0)
-                self.monthly_income_label.setText(f"💰 Income: Rp {income:,.0f}"); self.monthly_income_label.setStyleSheet("color:#059669;font-weight:600;margin:3px 0;")
-                self.monthly_expense_label.setText(f"💸 Expenses: Rp {expense:,.0f}"); self.monthly_expense_label.setStyleSheet("color:#dc2626;font-weight:600;margin:3px 0;")
-                bal_color = '#059669' if balance >=0 else '#dc2626'
-                self.monthly_balance_label.setText(f"📊 Balance: Rp {balance:,.0f}"); self.monthly_balance_label.setStyleSheet(f"color:{bal_color};font-weight:600;margin:3px 0;")
-                self.monthly_transactions_label.setText(f"🧾 Transactions: {txn_count}"); self.monthly_transactions_label.setStyleSheet("color:#4b5563;font-weight:600;margin:3px 0;")
+                if summary is None:
+                    summary = self.api_client.get_transaction_summary().get('summary', {})
+                txn_count = summary.get('transaction_count', 0)
+                self.monthly_income_label.setText(f"💰 Income: Rp {income:,.0f}"); _set_role(self.monthly_income_label, "incomeRow")
+                self.monthly_expense_label.setText(f"💸 Expenses: Rp {expense:,.0f}"); _set_role(self.monthly_expense_label, "expenseRow")
+                self.monthly_balance_label.setText(f"📊 Balance: Rp {balance:,.0f}"); _set_role(self.monthly_balance_label, "balancePos" if balance >= 0 else "balanceNeg")
+                self.monthly_transactions_label.setText(f"🧾 Transactions: {txn_count}"); _set_role(self.monthly_transactions_label, "txnRow")
             else:
                 self.monthly_income_label.setText("💰 Income: Rp 0"); self.monthly_expense_label.setText("💸 Expenses: Rp 0"); self.monthly_balance_label.setText("📊 Balance: Rp 0"); self.monthly_transactions_label.setText("🧾 Transactions: 0")
         except Exception as e:
             log_app_event("reports_update_monthly_overview_error", "ReportsPage", {"error": str(e)})
     
+    def _apply_rows(self, layout, rows, entries):
+        """Apply (text, role) entries to a pooled list of row labels.
+
+        Grows the pool lazily, mutates setText/objectName in place and
+        hides surplus rows, mirroring the recent-activity card: no
+        deleteLater()/addWidget churn or layout invalidation per refresh.
+        """
+        if not rows:
+            _clear_layout(layout)  # drop the loading label
+        while len(rows) < len(entries):
+            lbl = QLabel(); lbl.setFont(_FONT_ROW); layout.addWidget(lbl); rows.append(lbl)
+        for lbl, (text, role) in zip(rows, entries):
+            if lbl.text() != text:
+                lbl.setText(text)
+            _set_role(lbl, role)
+            lbl.setVisible(True)
+        for i in range(len(entries), len(rows)):
+            rows[i].hide()
+
     def update_category_distribution(self, data):
         try:
-            while self.category_stats_layout.count():
-                child = self.category_stats_layout.takeAt(0)
-                if child.widget(): child.widget().deleteLater()
             categories = data.get('category_distribution', [])
             if categories:
-                for category in categories[:5]:
-                    name = category.get('category_name', 'Unknown'); amount = abs(category.get('total_amount', 0)); count = category.get('transaction_count', 0)
-                    item = QLabel(f"{name} — Rp {amount:,.0f} ({count} txn)"); item.setFont(QFont('Segoe UI',11)); item.setStyleSheet("color:#374151;margin:2px 0;"); self.category_stats_layout.addWidget(item)
+                entries = [(f"{c.get('category_name', 'Unknown')} — Rp {abs(c.get('total_amount', 0)):,.0f} ({c.get('transaction_count', 0)} txn)", "statRow")
+                           for c in categories[:5]]
             else:
-                nd = QLabel("No category data available"); nd.setFont(QFont('Segoe UI',11)); nd.setStyleSheet("color:#9ca3af;"); self.category_stats_layout.addWidget(nd)
+                entries = [("No category data available", "noData")]
+            self._apply_rows(self.category_stats_layout, self._category_rows, entries)
         except Exception as e:
             log_app_event("reports_update_category_distribution_error", "ReportsPage", {"error": str(e)})
-    
+
     def update_ai_stats(self, data):
         try:
-            while self.ai_stats_layout.count():
-                child = self.ai_stats_layout.takeAt(0)
-                if child.widget(): child.widget().deleteLater()
-            methods = data.get('prediction_methods', [])
-            total = sum(m.get('count',0) for m in methods)
-            if methods and total>0:
-                display = {'ai_prediction': '🤖 AI Prediction','manual':'👤 Manual','default':'⚡ Default'}
-                for m in methods:
-                    name = display.get(m.get('method','unknown'), m.get('method','unknown').title()); count = m.get('count',0); pct = (count/total)*100 if total else 0
-                    lbl = QLabel(f"{name}: {pct:.1f}% ({count})"); lbl.setFont(QFont('Segoe UI',11)); lbl.setStyleSheet("color:#6366f1;margin:2px 0;"); self.ai_stats_layout.addWidget(lbl)
+            # One walk over the method dicts materializes (name, count)
+            # tuples; the formatting pass then reuses them instead of
+            # re-running the .get chains against the dicts.
+            items = [(m.get('method', 'unknown'), m.get('count', 0))
+                     for m in data.get('prediction_methods', [])]
+            total = sum(c for _, c in items)
+            if total > 0:
+                entries = [(f"{_AI_METHOD_NAMES.get(name, name.title())}: {(c / total) * 100:.1f}% ({c})", "aiRow")
+                           for name, c in items]
             else:
-                nd = QLabel("No prediction data available"); nd.setFont(QFont('Segoe UI',11)); nd.setStyleSheet("color:#9ca3af;"); self.ai_stats_layout.addWidget(nd)
+                entries = [("No prediction data available", "noData")]
+            self._apply_rows(self.ai_stats_layout, self._ai_rows, entries)
         except Exception as e:
             log_app_event("reports_update_ai_stats_error", "ReportsPage", {"error": str(e)})
-    
+
     def update_top_categories(self, data):
         try:
-            while self.top_categories_layout.count():
-                child = self.top_categories_layout.takeAt(0)
-                if child.widget(): child.widget().deleteLater()
             categories = data.get('category_distribution', [])
             if categories:
                 sorted_cats = sorted(categories, key=lambda x: abs(x.get('total_amount',0)), reverse=True)
-                medals = ['🥇','🥈','🥉']
-                for i, cat in enumerate(sorted_cats[:3]):
-                    name = cat.get('category_name','Unknown'); amount = abs(cat.get('total_amount',0)); avg = abs(cat.get('avg_amount',0))
-                    lbl = QLabel(f"{medals[i] if i<3 else '🏅'} {name}: Rp {amount:,.0f} (Avg Rp {avg:,.0f})"); lbl.setFont(QFont('Segoe UI',11)); lbl.setStyleSheet("color:#1f2937;margin:3px 0;"); self.top_categories_layout.addWidget(lbl)
+                entries = [(f"{_MEDALS[i] if i < 3 else '🏅'} {cat.get('category_name', 'Unknown')}: Rp {abs(cat.get('total_amount', 0)):,.0f} (Avg Rp {abs(cat.get('avg_amount', 0)):,.0f})", "topRow")
+                           for i, cat in enumerate(sorted_cats[:3])]
             else:
-                nd = QLabel("No spending data available"); nd.setFont(QFont('Segoe UI',11)); nd.setStyleSheet("color:#9ca3af;"); self.top_categories_layout.addWidget(nd)
+                entries = [("No spending data available", "noData")]
+            self._apply_rows(self.top_categories_layout, self._top_cat_rows, entries)
         except Exception as e:
             log_app_event("reports_update_top_categories_error", "ReportsPage", {"error": str(e)})
     
     def update_recent_summary(self, data):
+        # N rapid calls within the debounce window collapse into a single
+        # rebuild of the latest data.
+        self._pending_recent_data = data
+        self._recent_refresh_timer.start()
+
+    def _do_update_recent_summary(self):
+        # Row HTML is built on the thread pool; only the cheap setText on
+        # pooled labels runs on the UI thread (queued back via signal).
+        try:
+            data = self._pending_recent_data or {}
+            worker = _RecentRowsBuilder(data.get('transactions', []))
+            worker.signals.finished.connect(self._apply_recent_summary,
+                                            Qt.QueuedConnection)
+            self._recent_worker = worker  # keep signal owner alive
+            QThreadPool.globalInstance().start(worker)
+        except Exception as e:
+            log_app_event("reports_update_recent_summary_error", "ReportsPage", {"error": str(e)})
+
+    def _apply_recent_summary(self, texts):
+        # Rows are pooled: mutate setText on existing labels and hide any
+        # surplus instead of rebuilding widgets every refresh.
         try:
-            while self.recent_summary_layout.count():
-                child = self.recent_summary_layout.takeAt(0)
-                if child.widget(): child.widget().deleteLater()
-            txs = data.get('transactions', [])
-            if txs:
-                for tx in txs[:5]:
-                    desc = tx.get('description','Unknown'); amount = tx.get('amount',0); cat = tx.get('category_name','No Category'); date = tx.get('transaction_date','')[:10]
-                    color = '#059669' if amount>0 else '#dc2626'; sign = '+' if amount>0 else ''
-                    lbl = QLabel(f"{date} • {cat} • {desc[:28] + '...' if len(desc)>28 else desc} — <span style='color:{color};font-weight:600'>{sign}Rp {abs(amount):,.0f}</span>")
-                    lbl.setFont(QFont('Segoe UI',10)); lbl.setTextFormat(Qt.RichText); lbl.setStyleSheet("color:#374151;margin:2px 0;")
-                    self.recent_summary_layout.addWidget(lbl)
+            rows = self._recent_rows
+            if not rows:
+                _clear_layout(self.recent_summary_layout)  # drop the loading label
+            while len(rows) < max(len(texts), 1):
+                lbl = QLabel()
+                lbl.setFont(_FONT_ROW_SMALL); lbl.setTextFormat(Qt.RichText); lbl.setObjectName("statRow")
+                self.recent_summary_layout.addWidget(lbl); rows.append(lbl)
+            if texts:
+                for i, text in enumerate(texts):
+                    # Transactions rarely change between refreshes; skip
+                    # setText (and the repaint it schedules) for clean rows.
+                    if self._row_text_cache.get(i) != text:
+                        rows[i].setText(text)
+                        self._row_text_cache[i] = text
+                    rows[i].setVisible(True)
+                hidden_from = len(texts)
             else:
-                nd = QLabel("No recent transactions"); nd.setFont(QFont('Segoe UI',11)); nd.setStyleSheet("color:#9ca3af;"); self.recent_summary_layout.addWidget(nd)
+                rows[0].setText("<span style='color:#9ca3af'>No recent transactions</span>")
+                rows[0].setVisible(True)
+                self._row_text_cache.pop(0, None)
+                hidden_from = 1
+            for i in range(hidden_from, len(rows)):
+                rows[i].hide()
+                self._row_text_cache.pop(i, None)
         except Exception as e:
             log_app_event("reports_update_recent_summary_error", "ReportsPage", {"error": str(e)})
     
@@ -204,47 +468,57 @@ class ReportsPage(QWidget):
             if 'monthly_stats' in monthly_data: raw = monthly_data.get('monthly_stats', [])
             elif 'months' in monthly_data: raw = monthly_data.get('months', [])
             elif isinstance(monthly_data, list): raw = monthly_data
-            cleaned = []
-            for item in raw:
-                mkey = item.get('month') or item.get('period') or item.get('date')
-                if not mkey: continue
-                mid = mkey[:7]
-                inc = item.get('income') or item.get('total_income') or 0
-                exp = item.get('expense') or item.get('total_expense') or 0
-                bal = item.get('balance') or (inc - abs(exp))
-                cleaned.append({'month': mid,'income': float(inc),'expense': float(exp),'balance': float(bal)})
-            cleaned.sort(key=lambda x: x['month'])
-            # Clear layout
-            while self.trend_info_layout.count():
-                child = self.trend_info_layout.takeAt(0)
-                if child.widget(): child.widget().deleteLater()
-            if not cleaned:
-                self.trend_info_layout.addWidget(QLabel("No data")); return
-            def fmt_month(m):
+            cleaned = [r for r in map(_extract_trend_row, raw) if r is not None]
+            months, incomes, expenses, balances = (
+                map(list, zip(*cleaned)) if cleaned else ([], [], [], []))
+            # Build the chart canvas and table label once; later refreshes
+            # only clear/redraw the axes and setText the table instead of
+            # reconstructing a Figure/FigureCanvas per reload.
+            if self._trend_table is None:
+                _clear_layout(self.trend_info_layout)  # drop the loading label
                 try:
-                    y, mo = m.split('-'); names=['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec']; return f"{names[int(mo)-1]} {y}"
-                except Exception: return m
-            # Chart
-            try:
-                from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-                from matplotlib.figure import Figure
-                fig = Figure(figsize=(4,2.2)); ax = fig.add_subplot(111)
-                labels=[fmt_month(r['month']) for r in cleaned]; balances=[r['balance'] for r in cleaned]
-                ax.plot(labels, balances, marker='o', linewidth=2, color='#6366f1'); ax.fill_between(range(len(balances)), balances, color='#6366f1', alpha=0.08)
+                    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+                    from matplotlib.figure import Figure
+                    self._trend_fig = Figure(figsize=(4,2.2))
+                    self._trend_ax = self._trend_fig.add_subplot(111)
+                    self._trend_canvas = FigureCanvas(self._trend_fig)
+                    self.trend_info_layout.addWidget(self._trend_canvas)
+                except Exception as chart_err:
+                    err=QLabel(f"Chart error: {chart_err}"); err.setStyleSheet('color:#dc2626;'); self.trend_info_layout.addWidget(err)
+                self._trend_table = QLabel()
+                self._trend_table.setTextFormat(Qt.RichText)
+                self.trend_info_layout.addWidget(self._trend_table)
+            if not months:
+                self._trend_table.setText("No data"); return
+            # Numeric work stays in NumPy: one argsort orders every column,
+            # and the balance deltas come from a single np.diff instead of
+            # the old per-row cleaned.index() scan (O(n^2)).
+            order = np.argsort(months)
+            months = [months[i] for i in order]
+            income_arr = np.asarray(incomes)[order]
+            expense_arr = np.asarray(expenses)[order]
+            balance_arr = np.asarray(balances)[order]
+            deltas = np.diff(balance_arr, prepend=balance_arr[0])
+            # Chart: redraw the persistent axes; draw_idle coalesces the
+            # repaint instead of forcing a synchronous render.
+            if self._trend_canvas is not None:
+                ax = self._trend_ax
+                ax.clear()
+                labels=[fmt_month(m) for m in months]
+                ax.plot(labels, balance_arr, marker='o', linewidth=2, color='#6366f1'); ax.fill_between(range(len(balance_arr)), balance_arr, color='#6366f1', alpha=0.08)
                 ax.set_ylabel('Balance (IDR)')
                 ax.set_xticklabels(labels, rotation=0, ha='center', fontsize=9)
                 ax.grid(axis='y', linestyle='--', alpha=0.3)
-                fig.tight_layout()
-                canvas=FigureCanvas(fig); self.trend_info_layout.addWidget(canvas)
-            except Exception as chart_err:
-                err=QLabel(f"Chart error: {chart_err}"); err.setStyleSheet('color:#dc2626;'); self.trend_info_layout.addWidget(err)
+                self._trend_fig.tight_layout()
+                self._trend_canvas.draw_idle()
             # Table
-            html_rows=[]
-            for r in cleaned[-6:]:
-                idx = cleaned.index(r); prev_bal = cleaned[idx-1]['balance'] if idx>0 else 0; delta = r['balance']-prev_bal if idx>0 else 0
-                html_rows.append(f"<tr><td style='padding:2px 8px'>{fmt_month(r['month'])}</td><td style='padding:2px 8px;text-align:right'>{r['income']:,.0f}</td><td style='padding:2px 8px;text-align:right'>{r['expense']:,.0f}</td><td style='padding:2px 8px;text-align:right'>{r['balance']:,.0f}</td><td style='padding:2px 8px;text-align:right'>{'+' if delta>0 else ''}{delta:,.0f}</td></tr>")
-            table=QLabel("<div style='margin-top:8px'><b>Recent 6 Months</b><br><table style='border-collapse:collapse;font-size:11px;color:#374151'><tr style='background:#f1f5f9'><th style='padding:2px 8px;text-align:left'>Month</th><th style='padding:2px 8px'>Income</th><th style='padding:2px 8px'>Expense</th><th style='padding:2px 8px'>Balance</th><th style='padding:2px 8px'>Δ Bal</th></tr>" + "".join(html_rows) + "</table></div>")
-            table.setTextFormat(Qt.RichText); self.trend_info_layout.addWidget(table)
-            log_app_event("reports_trends_loaded", "ReportsPage", {"months": len(cleaned)})
+            start = max(len(months) - 6, 0)
+            rows_html = "".join(
+                _ROW_TMPL.format(m=fmt_month(months[idx]), i=income_arr[idx],
+                                 e=expense_arr[idx], b=balance_arr[idx],
+                                 s='+' if deltas[idx] > 0 else '', d=deltas[idx])
+                for idx in range(start, len(months)))
+            self._trend_table.setText(_TABLE_OPEN + rows_html + "</table></div>")
+            log_app_event("reports_trends_loaded", "ReportsPage", {"months": len(months)})
         except Exception as e:
             log_app_event("reports_update_monthly_trends_error", "ReportsPage", {"error": str(e)})
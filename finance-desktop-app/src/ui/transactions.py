@@ -3,12 +3,14 @@ Transaction management UI components for Finance Desktop Application
 Add, edit, delete, and view transactions with AI categorization
 """
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, 
-                           QLineEdit, QPushButton, QLabel, QTableWidget, 
-                           QTableWidgetItem, QMessageBox, QComboBox, QDateEdit,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QFormLayout,
+                           QLineEdit, QPushButton, QLabel, QTableView,
+                           QStyledItemDelegate, QMessageBox, QComboBox, QDateEdit,
                            QDoubleSpinBox, QHeaderView, QAbstractItemView, QMenu, QAction,
                            QDialog, QShortcut, QCalendarWidget)
-from PyQt5.QtCore import Qt, QDate, QThread, pyqtSignal, QTimer, QEvent
+from PyQt5.QtCore import (Qt, QAbstractTableModel, QDate, QModelIndex, QObject,
+                          QRect, QRunnable, QThreadPool, pyqtSignal, QTimer,
+                          QEvent)
 from PyQt5.QtGui import QFont, QColor, QKeySequence, QTextCharFormat
 import sys
 import os
@@ -20,42 +22,248 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from api.client import APIClient
 from utils.logger import log_user_action, log_window_event, log_validation_error
+from .dashboard import emoji_pixmap
+
+# Amount foreground colors, allocated once instead of per table row
+_AMOUNT_POS = QColor('#10b981')
+_AMOUNT_NEG = QColor('#ef4444')
+
+# Transaction table columns
+_TABLE_HEADERS = ('Date', 'Description', 'Amount', 'Category', 'Actions')
+_COL_DATE, _COL_DESC, _COL_AMOUNT, _COL_CATEGORY, _COL_ACTIONS = range(5)
+
+# Shared cell fonts; one QFont per style instead of one per cell
+_FONT_CELL_DATE = QFont('Segoe UI', 10)
+_FONT_CELL = QFont('Segoe UI', 11)
+_FONT_CELL_AMOUNT = QFont('Segoe UI', 11, QFont.Bold)
+
+
+class TransactionTableModel(QAbstractTableModel):
+    """Read-only table model over the raw transaction dicts.
+
+    Stores the list by reference and formats cells on demand in data(),
+    so a refresh is one model reset instead of rows x columns
+    QTableWidgetItem allocations, and Qt only ever asks for the cells it
+    actually paints.
+    """
+
+    _SORT_KEYS = {
+        _COL_DATE: lambda t: t.get('transaction_date', ''),
+        _COL_DESC: lambda t: t.get('description', '').lower(),
+        _COL_AMOUNT: lambda t: t.get('amount', 0),
+        _COL_CATEGORY: lambda t: (t.get('category_name') or '').lower(),
+    }
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._cat_names = {}
+
+    def set_transactions(self, rows):
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def set_category_names(self, names_by_id):
+        """Install the category-id -> name map used when a transaction
+        carries only category_id instead of the embedded name."""
+        self._cat_names = names_by_id
+        if self._rows:
+            self.dataChanged.emit(self.index(0, _COL_CATEGORY),
+                                  self.index(len(self._rows) - 1, _COL_CATEGORY))
+
+    def transaction_at(self, row):
+        return self._rows[row]
+
+    def insert_transaction(self, row, transaction):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, transaction)
+        self.endInsertRows()
+
+    def remove_transaction(self, tx_id):
+        """Remove the row with the given id; returns the dict or None."""
+        for row, transaction in enumerate(self._rows):
+            if transaction.get('id') == tx_id:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._rows[row]
+                self.endRemoveRows()
+                return transaction
+        return None
+
+    def replace_transaction(self, transaction):
+        """Swap in an updated dict for the row with the same id."""
+        tx_id = transaction.get('id')
+        for row, existing in enumerate(self._rows):
+            if existing.get('id') == tx_id:
+                self._rows[row] = transaction
+                self.dataChanged.emit(self.index(row, 0),
+                                      self.index(row, len(_TABLE_HEADERS) - 1))
+                return True
+        return False
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_TABLE_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return _TABLE_HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        transaction = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            # Formatted strings are memoized on the transaction dict the
+            # first time a cell is painted; scrolling back over a row (or
+            # re-sorting) reuses them, and a reload naturally invalidates
+            # the cache because fresh dicts arrive from the API.
+            if col == _COL_DATE:
+                s = transaction.get('_display_date')
+                if s is None:
+                    s = transaction['_display_date'] = transaction.get('transaction_date', '')[:10]
+                return s
+            if col == _COL_DESC:
+                return transaction.get('description', '')
+            if col == _COL_AMOUNT:
+                s = transaction.get('_display_amount')
+                if s is None:
+                    s = transaction['_display_amount'] = f"Rp {transaction.get('amount', 0):,.2f}"
+                return s
+            if col == _COL_CATEGORY:
+                return (transaction.get('category_name')
+                        or self._cat_names.get(transaction.get('category_id'))
+                        or 'Uncategorized')
+        elif role == Qt.ForegroundRole and col == _COL_AMOUNT:
+            return _AMOUNT_NEG if transaction.get('amount', 0) < 0 else _AMOUNT_POS
+        elif role == Qt.TextAlignmentRole and col == _COL_AMOUNT:
+            return Qt.AlignRight | Qt.AlignVCenter
+        elif role == Qt.FontRole:
+            if col == _COL_DATE:
+                return _FONT_CELL_DATE
+            if col == _COL_AMOUNT:
+                return _FONT_CELL_AMOUNT
+            return _FONT_CELL
+        return None
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        key = self._SORT_KEYS.get(column)
+        if key is None:
+            return
+        self.layoutAboutToBeChanged.emit()
+        self._rows.sort(key=key, reverse=(order == Qt.DescendingOrder))
+        self.layoutChanged.emit()
+
+
+class TransactionActionsDelegate(QStyledItemDelegate):
+    """Paints the per-row action buttons and handles their clicks.
+
+    Two cached emoji pixmaps replace the old setCellWidget container
+    (a QWidget, a layout and two QPushButtons per row) that Qt had to
+    allocate, polish and composite for every visible transaction.
+    """
+
+    recategorize_clicked = pyqtSignal(int)
+    delete_clicked = pyqtSignal(int)
+
+    _ICON = 16
+    _HIT = 34  # clickable square around each icon
+
+    def _hit_rects(self, cell):
+        cx = cell.center().x()
+        y = cell.y() + (cell.height() - self._HIT) // 2
+        left = QRect(cx - self._HIT - 3, y, self._HIT, self._HIT)
+        right = QRect(cx + 3, y, self._HIT, self._HIT)
+        return left, right
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)  # selection/alternate background
+        for rect, ch in zip(self._hit_rects(option.rect), ('🤖', '🗑️')):
+            pm = emoji_pixmap(ch, self._ICON)
+            painter.drawPixmap(rect.x() + (rect.width() - pm.width()) // 2,
+                               rect.y() + (rect.height() - pm.height()) // 2, pm)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            left, right = self._hit_rects(option.rect)
+            tx_id = model.transaction_at(index.row()).get('id')
+            if tx_id is not None:
+                if left.contains(event.pos()):
+                    self.recategorize_clicked.emit(tx_id)
+                    return True
+                if right.contains(event.pos()):
+                    self.delete_clicked.emit(tx_id)
+                    return True
+        return super().editorEvent(event, model, option, index)
+
+class TransactionWorker(QRunnable):
+    """Runs one transaction API operation on the shared thread pool.
+
+    Replaces the old per-operation QThread: pool threads are reused
+    across save/load/delete/recategorize instead of paying OS thread
+    creation and teardown per click, and concurrent operations each keep
+    their own signals instead of overwriting a single self.worker.
+    """
+
+    class Signals(QObject):
+        success = pyqtSignal(dict)
+        error = pyqtSignal(str)
 
-class TransactionWorker(QThread):
-    """Worker thread for transaction operations"""
-    
-    success = pyqtSignal(dict)
-    error = pyqtSignal(str)
-    
     def __init__(self, api_client, operation, **kwargs):
         super().__init__()
         self.api_client = api_client
         self.operation = operation
         self.kwargs = kwargs
-    
+        self.signals = TransactionWorker.Signals()
+
     def run(self):
         """Run transaction operation in background"""
         try:
             if self.operation == 'create':
                 result = self.api_client.create_transaction(self.kwargs['data'])
-                self.success.emit(result)
             elif self.operation == 'update':
                 result = self.api_client.update_transaction(
-                    self.kwargs['id'], 
+                    self.kwargs['id'],
                     self.kwargs['data']
                 )
-                self.success.emit(result)
             elif self.operation == 'delete':
                 result = self.api_client.delete_transaction(self.kwargs['id'])
-                self.success.emit(result)
             elif self.operation == 'load':
                 result = self.api_client.get_transactions()
-                self.success.emit(result)
             elif self.operation == 'recategorize':
                 result = self.api_client.recategorize_transaction(self.kwargs['id'])
-                self.success.emit(result)
+            else:
+                return
+            self.signals.success.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
+
+class SuggestionWorker(QRunnable):
+    """Fetches one AI category suggestion on the shared thread pool.
+
+    Keeps the blocking HTTP call off the UI thread; the sequence number
+    travels with the response so the dialog can discard results that a
+    newer query has superseded.
+    """
+
+    class Signals(QObject):
+        done = pyqtSignal(int, str, dict)
+
+    def __init__(self, api_client, seq, description):
+        super().__init__()
+        self.api_client = api_client
+        self.seq = seq
+        self.description = description
+        self.signals = SuggestionWorker.Signals()
+
+    def run(self):
+        try:
+            data = self.api_client.suggest_categories(self.description)
+        except Exception:
+            data = {}
+        self.signals.done.emit(self.seq, self.description, data or {})
 
 class AddTransactionDialog(QDialog):
     """Dialog for adding new transaction"""
@@ -71,7 +279,15 @@ class AddTransactionDialog(QDialog):
         self.ai_timer = QTimer()
         self.ai_timer.setSingleShot(True)
         self.ai_timer.timeout.connect(self.get_ai_suggestion)
-        
+        # Last query actually sent plus a sequence counter give the AI
+        # suggestion last-write-wins semantics: stale responses never
+        # overwrite the label of a newer query
+        self._last_ai_query = None
+        self._ai_request_seq = 0
+        # In-flight suggestion workers, held so their signal owners stay
+        # alive until the callbacks fire
+        self._ai_workers = set()
+
         self.initUI()
     
     def initUI(self):
@@ -199,6 +415,10 @@ class AddTransactionDialog(QDialog):
         self.category_combo.addItem('-- Select Category --', None)
         for category in self.categories:
             self.category_combo.addItem(category['name'], category['id'])
+        # Name -> combo index lookup so AI auto-select is a dict hit instead
+        # of scanning itemText() across the sip boundary; offset 1 for the
+        # '-- Select Category --' sentinel
+        self._cat_index = {c['name']: i + 1 for i, c in enumerate(self.categories)}
         self.category_combo.setFont(QFont('Segoe UI', 12))
         self.category_combo.setFixedHeight(45)
         
@@ -399,12 +619,13 @@ class AddTransactionDialog(QDialog):
         
         # Disable form during save
         self.set_loading(True)
-        
-        # Start save operation in background
+
+        # Start save operation on the shared pool; keep a reference so the
+        # signal owner stays alive until the callbacks fire
         self.worker = TransactionWorker(self.api_client, 'create', data=transaction_data)
-        self.worker.success.connect(self.on_save_success)
-        self.worker.error.connect(self.on_save_error)
-        self.worker.start()
+        self.worker.signals.success.connect(self.on_save_success)
+        self.worker.signals.error.connect(self.on_save_error)
+        QThreadPool.globalInstance().start(self.worker)
     
     def on_save_success(self, result):
         """Handle successful save"""
@@ -422,8 +643,12 @@ class AddTransactionDialog(QDialog):
     def on_description_changed(self):
         # Stop previous timer
         self.ai_timer.stop()
-        
+
         description = self.description_edit.text().strip()
+        if description == self._last_ai_query:
+            # Micro-edits that strip to the already-queried text (trailing
+            # spaces, undo) don't restart the debounce or re-hit the AI
+            return
         if len(description) >= 3:
             # Start timer for debounced AI suggestion
             self.ai_timer.start(1000)
@@ -437,10 +662,21 @@ class AddTransactionDialog(QDialog):
         if not description:
             self.ai_suggestion_label.hide()
             return
-        
+
+        # Fetch on the pool so typing stays responsive; the bumped
+        # sequence number also marks any response still in flight as stale
+        self._ai_request_seq += 1
+        worker = SuggestionWorker(self.api_client, self._ai_request_seq, description)
+        worker.signals.done.connect(self.on_ai_suggestion)
+        self._ai_workers.add(worker)
+        worker.signals.done.connect(lambda *_, w=worker: self._ai_workers.discard(w))
+        QThreadPool.globalInstance().start(worker)
+
+    def on_ai_suggestion(self, seq, description, suggestion_data):
+        if seq != self._ai_request_seq:
+            # Superseded while in flight; the newer query owns the label
+            return
         try:
-            # Get AI suggestion from backend
-            suggestion_data = self.api_client.suggest_categories(description)
             log_user_action("ai_suggestion_response", "AddTransactionDialog", suggestion_data)
 
             category = None
@@ -478,17 +714,21 @@ class AddTransactionDialog(QDialog):
                     self.ai_suggestion_label.setText("🤖 New transaction type - please select category manually")
                 else:
                     self.ai_suggestion_label.setText("🤖 No AI suggestion available")
-                
+
+            # Recorded only once the response was handled, so a failed
+            # suggestion for the same text is retried on the next edit
+            self._last_ai_query = description
+
         except Exception as e:
             log_user_action("ai_suggestion_error", "AddTransactionDialog", {"error": str(e)})
             self.ai_suggestion_label.setText("🤖 AI service temporarily unavailable")
     
     def auto_select_category(self, category_name: str):
-        for i in range(self.category_combo.count()):
-            if self.category_combo.itemText(i) == category_name:
-                self.category_combo.setCurrentIndex(i)
-                return
-        
+        idx = self._cat_index.get(category_name)
+        if idx is not None:
+            self.category_combo.setCurrentIndex(idx)
+            return
+
         # If category doesn't exist, create it and add to dropdown
         self.create_and_select_category(category_name)
     
@@ -520,6 +760,7 @@ class AddTransactionDialog(QDialog):
                 
                 # Add to dropdown and select it
                 self.category_combo.addItem(new_category['name'], new_category['id'])
+                self._cat_index[new_category['name']] = self.category_combo.count() - 1
                 self.category_combo.setCurrentIndex(self.category_combo.count() - 1)
                 
                 # Update the AI suggestion to show it was created
@@ -538,11 +779,12 @@ class AddTransactionDialog(QDialog):
             if result and 'categories' in result:
                 self.categories = result['categories']
                 
-                # Rebuild dropdown
+                # Rebuild dropdown and the name -> index lookup
                 self.category_combo.clear()
                 self.category_combo.addItem('-- Select Category --', None)
                 for category in self.categories:
                     self.category_combo.addItem(category['name'], category['id'])
+                self._cat_index = {c['name']: i + 1 for i, c in enumerate(self.categories)}
                 
                 # Try to select the desired category
                 for i in range(self.category_combo.count()):
@@ -585,7 +827,10 @@ class TransactionListWidget(QWidget):
         self.transactions = []
         self.filtered_transactions = []
         self.categories = []
-        self.worker = None
+        self._cat_by_id = {}
+        # In-flight pool workers; holding them keeps their signal owners
+        # alive and lets operations overlap without dropping callbacks
+        self._pending_workers = set()
         self.search_bar = None
         self.search_visible = False
         # Refresh debounce/cooldown
@@ -639,43 +884,43 @@ class TransactionListWidget(QWidget):
         self.search_bar.installEventFilter(self)
         layout.addWidget(self.search_bar)
         
-        # Transaction table
-        self.table = QTableWidget()
-        self.table.setColumnCount(6)
-        self.table.setHorizontalHeaderLabels([
-            'Date', 'Description', 'Amount', 'Category', 'Actions', 'ID'
-        ])
-        
+        # Transaction table: a QTableView over TransactionTableModel. A
+        # refresh is one model reset, cells are formatted only when
+        # painted, and the Actions column is a delegate instead of a
+        # per-row widget tree.
+        self.model = TransactionTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+
         # Set column widths
         header = self.table.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.Fixed)
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-        header.setSectionResizeMode(2, QHeaderView.Fixed)
-        header.setSectionResizeMode(3, QHeaderView.Fixed)
-        header.setSectionResizeMode(4, QHeaderView.Fixed)
-        
-        self.table.setColumnWidth(0, 150)  # Date
-        self.table.setColumnWidth(2, 170)  # Amount
-        self.table.setColumnWidth(3, 160)  # Category
-        self.table.setColumnWidth(4, 140)  # Actions
-        
+        header.setSectionResizeMode(_COL_DATE, QHeaderView.Fixed)
+        header.setSectionResizeMode(_COL_DESC, QHeaderView.Stretch)
+        header.setSectionResizeMode(_COL_AMOUNT, QHeaderView.Fixed)
+        header.setSectionResizeMode(_COL_CATEGORY, QHeaderView.Fixed)
+        header.setSectionResizeMode(_COL_ACTIONS, QHeaderView.Fixed)
+
+        self.table.setColumnWidth(_COL_DATE, 150)
+        self.table.setColumnWidth(_COL_AMOUNT, 170)
+        self.table.setColumnWidth(_COL_CATEGORY, 160)
+        self.table.setColumnWidth(_COL_ACTIONS, 140)
+
         self.table.setWordWrap(True)
         self.table.verticalHeader().setDefaultSectionSize(52)
-        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-        
-        # Hide ID column
-        self.table.setColumnHidden(5, True)
-        
+
         # Set table properties
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.setAlternatingRowColors(True)
         self.table.setSortingEnabled(True)
         self.table.verticalHeader().setVisible(False)
         self.table.setShowGrid(False)
 
-        header.sectionClicked.connect(self.on_header_clicked)
-        self.sort_state = {"section": None, "order": Qt.AscendingOrder}
+        self._actions_delegate = TransactionActionsDelegate(self.table)
+        self._actions_delegate.recategorize_clicked.connect(self.recategorize_transaction)
+        self._actions_delegate.delete_clicked.connect(self.delete_transaction)
+        self.table.setItemDelegateForColumn(_COL_ACTIONS, self._actions_delegate)
 
         # Shortcuts with application-wide context for reliability
         self.shortcut_refresh = QShortcut(QKeySequence("Ctrl+R"), self)
@@ -730,7 +975,7 @@ class TransactionListWidget(QWidget):
                 border-color: #cbd5e0;
             }
             
-            QTableWidget {
+            QTableView {
                 border: 1px solid #e2e8f0;
                 border-radius: 12px;
                 background-color: white;
@@ -738,16 +983,16 @@ class TransactionListWidget(QWidget):
                 gridline-color: transparent;
             }
 
-            QTableWidget QWidget { background: transparent; }
+            QTableView QWidget { background: transparent; }
             
-            QTableWidget::item {
+            QTableView::item {
                 padding: 12px 14px;
                 border-bottom: 1px solid #f1f5f9;
                 color: #2d3748;
                 min-height: 40px;
             }
             
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #e0e7ff;
                 color: #2d3748;
             }
@@ -764,7 +1009,7 @@ class TransactionListWidget(QWidget):
                 letter-spacing: 0.5px;
             }
             
-            QTableWidget::item:alternate {
+            QTableView::item:alternate {
                 background-color: #f8fafc;
             }
             QHeaderView {
@@ -797,19 +1042,31 @@ class TransactionListWidget(QWidget):
         try:
             result = self.api_client.get_categories()
             self.categories = result.get('data', [])
+            # id -> name map lets the table resolve rows that ship only
+            # category_id in one dict lookup
+            self._cat_by_id = {c['id']: c['name'] for c in self.categories}
+            self.model.set_category_names(self._cat_by_id)
         except Exception as e:
             log_user_action("load_categories_error", "TransactionListWidget", {"error": str(e)})
     
+    def _start_worker(self, operation, on_success, on_error, **kwargs):
+        """Dispatch an operation to the shared pool and track it in flight."""
+        worker = TransactionWorker(self.api_client, operation, **kwargs)
+        worker.signals.success.connect(on_success)
+        worker.signals.error.connect(on_error)
+        self._pending_workers.add(worker)
+        done = lambda _=None, w=worker: self._pending_workers.discard(w)
+        worker.signals.success.connect(done)
+        worker.signals.error.connect(done)
+        QThreadPool.globalInstance().start(worker)
+
     def load_transactions(self):
         """Load transactions from backend"""
         if self.refresh_btn.isEnabled():
             log_user_action("load_transactions", "TransactionListWidget")
             self.set_loading(True)
 
-            self.worker = TransactionWorker(self.api_client, 'load')
-            self.worker.success.connect(self.on_load_success)
-            self.worker.error.connect(self.on_load_error)
-            self.worker.start()
+            self._start_worker('load', self.on_load_success, self.on_load_error)
 
             self._begin_refresh_cooldown()
         else:
@@ -831,56 +1088,7 @@ class TransactionListWidget(QWidget):
     
     def populate_table(self):
         data = self.filtered_transactions if self.filtered_transactions is not None else self.transactions
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(len(data))
-        for row, transaction in enumerate(data):
-            # Date
-            date_str = transaction.get('transaction_date', '')[:10]
-            date_item = QTableWidgetItem(date_str)
-            date_item.setFont(QFont('Segoe UI', 10))
-            self.table.setItem(row, 0, date_item)
-            
-            # Description
-            description_text = transaction.get('description', '')
-            desc_item = QTableWidgetItem(description_text)
-            desc_item.setFont(QFont('Segoe UI', 11))
-            desc_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)
-
-            self.table.setItem(row, 1, desc_item)
-
-            if len(description_text) > 90:
-                self.table.setRowHeight(row, 78)
-            elif len(description_text) > 45:
-                self.table.setRowHeight(row, 64)
-            else:
-                self.table.setRowHeight(row, 46)
-            
-            # Amount
-            amount = transaction.get('amount', 0)
-            amount_item = QTableWidgetItem(f"Rp {amount:,.2f}")
-            amount_item.setFont(QFont('Segoe UI', 11, QFont.Bold))
-            amount_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-            if amount < 0:
-                amount_item.setForeground(QColor('#ef4444'))
-            else:
-                amount_item.setForeground(QColor('#10b981'))
-            self.table.setItem(row, 2, amount_item)
-            
-            # Category
-            category_name = transaction.get('category_name', 'Uncategorized')
-            if not category_name or category_name == '':
-                category_name = 'Uncategorized'
-            category_item = QTableWidgetItem(category_name)
-            category_item.setFont(QFont('Segoe UI', 11))
-            self.table.setItem(row, 3, category_item)
-            
-            actions_widget = self.create_action_buttons(transaction)
-            self.table.setCellWidget(row, 4, actions_widget)
-            
-            id_item = QTableWidgetItem(str(transaction.get('id', '')))
-            self.table.setItem(row, 5, id_item)
-        
-        self.table.setSortingEnabled(True)
+        self.model.set_transactions(data)
 
     def apply_filter(self):
         term = self.search_bar.text().strip().lower()
@@ -906,50 +1114,6 @@ class TransactionListWidget(QWidget):
                 return True
         return super().eventFilter(obj, event)
     
-    def create_action_buttons(self, transaction):
-        widget = QWidget()
-        widget.setAttribute(Qt.WA_StyledBackground, True)
-        widget.setStyleSheet("background: transparent;")
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(6)
-        layout.addStretch(1)
-
-        btn_style = """
-            QPushButton {
-                border: none;
-                background: transparent;
-                font-weight: 600;
-                padding: 0px;
-            }
-            QPushButton:hover {
-                background: rgba(99,102,241,0.10);
-                border-radius: 6px;
-            }
-        """
-
-        recategorize_btn = QPushButton('🤖')
-        recategorize_btn.setToolTip('Recategorize with AI')
-        recategorize_btn.setFixedSize(34, 34)
-        recategorize_btn.setFont(QFont('Segoe UI', 16))
-        recategorize_btn.setStyleSheet(btn_style)
-        recategorize_btn.setCursor(Qt.PointingHandCursor)
-        recategorize_btn.clicked.connect(lambda: self.recategorize_transaction(transaction['id']))
-
-        delete_btn = QPushButton('🗑️')
-        delete_btn.setToolTip('Delete transaction')
-        delete_btn.setFixedSize(34, 34)
-        delete_btn.setFont(QFont('Segoe UI', 16))
-        delete_btn.setStyleSheet(btn_style)
-        delete_btn.setCursor(Qt.PointingHandCursor)
-        delete_btn.clicked.connect(lambda: self.delete_transaction(transaction['id']))
-
-        layout.addWidget(recategorize_btn)
-        layout.addWidget(delete_btn)
-        layout.addStretch(1)
-        widget.setMinimumHeight(40)
-        return widget
-    
     def show_add_dialog(self):
         """Show add transaction dialog"""
         log_user_action("show_add_transaction_dialog", "TransactionListWidget")
@@ -961,7 +1125,18 @@ class TransactionListWidget(QWidget):
     def on_transaction_added(self, result):
         """Handle new transaction added"""
         log_user_action("transaction_added", "TransactionListWidget")
-        self.load_transactions()
+        # The create response embeds the stored transaction, so prepend it
+        # in place instead of re-fetching and rebuilding the whole list
+        transaction = result.get('transaction')
+        if not transaction:
+            self.load_transactions()
+            return
+        if self.filtered_transactions is self.transactions:
+            # Model holds the same list; it does the insert
+            self.model.insert_transaction(0, transaction)
+        else:
+            self.transactions.insert(0, transaction)
+            self.apply_filter()
     
     def recategorize_transaction(self, transaction_id):
         """Recategorize transaction using AI"""
@@ -979,16 +1154,22 @@ class TransactionListWidget(QWidget):
         
         if reply == QMessageBox.Yes:
             # Start recategorize operation
-            self.worker = TransactionWorker(self.api_client, 'recategorize', id=transaction_id)
-            self.worker.success.connect(self.on_recategorize_success)
-            self.worker.error.connect(self.on_recategorize_error)
-            self.worker.start()
+            self._start_worker('recategorize', self.on_recategorize_success,
+                               self.on_recategorize_error, id=transaction_id)
     
     def on_recategorize_success(self, result):
         """Handle successful recategorization"""
         log_user_action("recategorize_success", "TransactionListWidget")
         QMessageBox.information(self, 'Success', 'Transaction recategorized successfully!')
-        self.load_transactions()
+        updated = result.get('transaction')
+        if not (updated and self.model.replace_transaction(updated)):
+            self.load_transactions()
+            return
+        if self.filtered_transactions is not self.transactions:
+            for i, transaction in enumerate(self.transactions):
+                if transaction.get('id') == updated.get('id'):
+                    self.transactions[i] = updated
+                    break
     
     def on_recategorize_error(self, error_message):
         """Handle recategorization error"""
@@ -1009,17 +1190,23 @@ class TransactionListWidget(QWidget):
         )
         
         if reply == QMessageBox.Yes:
-            # Start delete operation
-            self.worker = TransactionWorker(self.api_client, 'delete', id=transaction_id)
-            self.worker.success.connect(self.on_delete_success)
-            self.worker.error.connect(self.on_delete_error)
-            self.worker.start()
-    
-    def on_delete_success(self, result):
+            # Start delete operation; the response only carries a message,
+            # so bind the id here for the in-place row removal
+            self._start_worker(
+                'delete',
+                lambda result, tx_id=transaction_id: self.on_delete_success(result, tx_id),
+                self.on_delete_error, id=transaction_id)
+
+    def on_delete_success(self, result, transaction_id):
         """Handle successful deletion"""
         log_user_action("delete_success", "TransactionListWidget")
         QMessageBox.information(self, 'Success', 'Transaction deleted successfully!')
-        self.load_transactions()
+        if self.model.remove_transaction(transaction_id) is None:
+            self.load_transactions()
+            return
+        if self.filtered_transactions is not self.transactions:
+            self.transactions = [t for t in self.transactions
+                                 if t.get('id') != transaction_id]
     
     def on_delete_error(self, error_message):
         """Handle deletion error"""
@@ -1073,41 +1260,4 @@ class TransactionListWidget(QWidget):
     def _shortcut_new_triggered(self):
         log_user_action("shortcut_new", "TransactionListWidget")
         if self.add_btn.isEnabled():
-            self.show_add_dialog()
-
-
-    # ----- Sorting helpers -----
-    def on_header_clicked(self, section: int):
-        current_section = self.sort_state.get("section")
-        if current_section == section:
-            new_order = Qt.DescendingOrder if self.sort_state.get("order") == Qt.AscendingOrder else Qt.AscendingOrder
-        else:
-            new_order = Qt.AscendingOrder
-        self.sort_state = {"section": section, "order": new_order}
-        self.table.sortItems(section, new_order)
-        self.update_sort_indicators()
-
-    def update_sort_indicators(self):
-        header = self.table.horizontalHeader()
-        active_section = self.sort_state.get("section")
-        order = self.sort_state.get("order")
-        arrow_up = ""
-        arrow_down = ""
-        for col in range(self.table.columnCount()):
-            item_text = self.table.horizontalHeaderItem(col).text().split(" ")
-
-            if item_text and item_text[-1] in (arrow_up, arrow_down):
-                item_text = item_text[:-1]
-            base = " ".join(item_text)
-            if col == active_section:
-                arrow = arrow_up if order == Qt.AscendingOrder else arrow_down
-                self.table.horizontalHeaderItem(col).setText(f"{base} {arrow}")
-
-                font = self.table.horizontalHeaderItem(col).font()
-                font.setBold(True)
-                self.table.horizontalHeaderItem(col).setFont(font)
-            else:
-                self.table.horizontalHeaderItem(col).setText(base)
-                font = self.table.horizontalHeaderItem(col).font()
-                font.setBold(False)
-                self.table.horizontalHeaderItem(col).setFont(font)
\ No newline at end of file
+            self.show_add_dialog()
\ No newline at end of file
@@ -4,7 +4,9 @@ Provides comprehensive logging for user actions, API calls, and application even
 """
 
 import logging
+import queue
 import sys
+import threading
 from datetime import datetime
 from typing import Any, Dict, Optional
 import json
@@ -62,7 +64,23 @@ class FinanceLogger:
         
         # Prevent propagation to root logger
         self.logger.propagate = False
-    
+
+        # UI-slot events are enqueued and drained by a daemon thread so the
+        # interactive path never pays JSON formatting or stdio cost
+        self._queue = queue.Queue()
+        self._drainer = threading.Thread(target=self._drain, daemon=True)
+        self._drainer.start()
+
+    def _drain(self):
+        while True:
+            emit, args = self._queue.get()
+            try:
+                emit(*args)
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
+
     def debug(self, message: str, **kwargs):
         """Log debug message"""
         self.logger.debug(self._format_message(message, **kwargs))
@@ -84,7 +102,10 @@ class FinanceLogger:
         self.logger.critical(self._format_message(message, **kwargs))
     
     def user_action(self, action: str, component: str, details: Optional[Dict] = None):
-        """Log user action"""
+        """Log user action (formatted off the calling thread)"""
+        self._queue.put_nowait((self._emit_user_action, (action, component, details)))
+
+    def _emit_user_action(self, action: str, component: str, details: Optional[Dict] = None):
         extra_info = {'log_type': 'USER_ACTION'}
         message = f"USER ACTION | {component} | {action}"
         
@@ -128,7 +149,10 @@ class FinanceLogger:
             self.logger.info(message, extra=extra_info)
     
     def app_event(self, event: str, component: str, details: Optional[Dict] = None):
-        """Log application event"""
+        """Log application event (formatted off the calling thread)"""
+        self._queue.put_nowait((self._emit_app_event, (event, component, details)))
+
+    def _emit_app_event(self, event: str, component: str, details: Optional[Dict] = None):
         message = f"⚡ APP EVENT | {component} | {event}"
         
         if details:
@@ -138,7 +162,10 @@ class FinanceLogger:
         self.logger.info(message)
     
     def window_event(self, window: str, event: str, details: Optional[Dict] = None):
-        """Log window/UI event"""
+        """Log window/UI event (formatted off the calling thread)"""
+        self._queue.put_nowait((self._emit_window_event, (window, event, details)))
+
+    def _emit_window_event(self, window: str, event: str, details: Optional[Dict] = None):
         message = f"WINDOW EVENT | {window} | {event}"
         
         if details:
@@ -1,4 +1,5 @@
 import sys, os
+import time
 import pytest
 from unittest.mock import Mock
 from PyQt5.QtWidgets import QApplication
@@ -45,6 +46,12 @@ def mock_api():
         ]
     }
     m.get_transaction_summary.return_value = {'summary': {'transaction_count': 3}}
+    m.get_reports_bundle.return_value = {
+        'monthly_stats': m.get_monthly_stats.return_value['monthly_stats'],
+        'category_stats': m.get_category_stats.return_value,
+        'transactions': m.get_transactions.return_value['transactions'],
+        'transaction_summary': m.get_transaction_summary.return_value['summary'],
+    }
     return m
 
 class TestReportsPage:
@@ -56,6 +63,12 @@ class TestReportsPage:
     def test_load_all_populates(self, app, mock_api):
         page = ReportsPage(mock_api)
         page.load_all()
+        # load_all now fetches on a worker thread; spin the event loop
+        # until the bundle has been applied
+        deadline = time.time() + 5
+        while 'Loading' in page.monthly_income_label.text() and time.time() < deadline:
+            app.processEvents()
+            time.sleep(0.01)
         assert 'Income:' in page.monthly_income_label.text()
         assert page.category_stats_layout.count() > 0
         assert page.ai_stats_layout.count() > 0